@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import os
+import shutil
+
+import pytest
+
+from corpus import FORMATS, generate_corpus
+
+# total number of files in the generated corpus
+CORPUS_SIZE = int(os.environ.get("TAGLIB_BENCHMARK_FILES", "2000"))
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory) -> dict[str, list]:
+    """Synthetic corpus of files, as a dict mapping formats to paths."""
+    paths = generate_corpus(tmp_path_factory.mktemp("corpus"), CORPUS_SIZE)
+    return {fmt: [path for path in paths if path.suffix == f".{fmt}"] for fmt in FORMATS}
+
+
+@pytest.fixture
+def writable_copies(corpus, tmp_path):
+    """Fresh copies of (some) corpus files for benchmarks that modify them."""
+    def result(fmt, count=50):
+        copies = []
+        for path in corpus[fmt][:count]:
+            shutil.copyfile(path, tmp_path / path.name)
+            copies.append(tmp_path / path.name)
+        return copies
+
+    return result
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+"""Generate a synthetic corpus of audio files for benchmarking.
+
+The files are copies of templates from ``tests/data`` (one per format) with a varying number of
+tags and embedded pictures of varying size. Generation is deterministic for a given seed:
+
+    python benchmarks/corpus.py TARGET_DIR [--count N] [--seed S]
+"""
+import argparse
+import random
+import shutil
+from pathlib import Path
+
+import taglib
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+# one template file per format
+TEMPLATES = {
+    "mp3": DATA_DIR / "r2.mp3",
+    "flac": DATA_DIR / "no-tags.flac",
+    "m4a": DATA_DIR / "has-tags.m4a",
+    "ogg": DATA_DIR / "lowercase-fields.ogg",
+}
+FORMATS = tuple(TEMPLATES)
+
+# number of extra tags per file and size of the embedded picture in bytes (0: no picture)
+TAG_COUNTS = (5, 20, 50)
+PICTURE_SIZES = (0, 0, 10_000, 200_000)
+
+STANDARD_KEYS = ("ARTIST", "ALBUM", "TITLE", "GENRE", "DATE", "COMMENT", "COMPOSER", "TRACKNUMBER")
+
+
+def random_tags(rng: random.Random, count: int) -> dict[str, list[str]]:
+    tags = {key: [f"{key.lower()} {rng.randrange(1000)}"] for key in STANDARD_KEYS}
+    for i in range(count):
+        tags[f"CUSTOM{i}"] = [f"value {rng.random()}" for _ in range(rng.randint(1, 3))]
+    return tags
+
+
+def random_picture(rng: random.Random, size: int) -> taglib.Picture:
+    # TagLib does not decode images, so random data behind a PNG signature will do
+    return taglib.Picture(data=b"\x89PNG\r\n\x1a\n" + rng.randbytes(size - 8), mime_type="image/png")
+
+
+def generate_corpus(target: Path, count: int, formats=FORMATS, seed: int = 0) -> list[Path]:
+    """Create ``count`` files in ``target``, spread evenly over ``formats``.
+
+    Returns:
+        The paths of the created files.
+    """
+    rng = random.Random(seed)
+    target.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        path = target / f"{i:06d}.{fmt}"
+        shutil.copyfile(TEMPLATES[fmt], path)
+        with taglib.File(path) as f:
+            f.tags = random_tags(rng, rng.choice(TAG_COUNTS))
+            picture_size = rng.choice(PICTURE_SIZES)
+            if picture_size:
+                f.pictures = [random_picture(rng, picture_size)]
+            f.save()
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("target", type=Path, help="directory to create the files in")
+    parser.add_argument("--count", type=int, default=1000, help="number of files to create")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    paths = generate_corpus(args.target, args.count, seed=args.seed)
+    print(f"created {len(paths)} files in {args.target}")
+
+
+if __name__ == "__main__":
+    main()
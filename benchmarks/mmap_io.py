@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+"""Compare reading files with TagLib's default file stream and with ``io="mmap"``.
+
+Reports the wall time of reading tags and audio properties of each file and, if ``strace`` is
+available (Linux), the number of system calls made per file. Without arguments, the files in
+``tests/data`` are used:
+
+    python benchmarks/mmap_io.py [--repeat N] [file ...]
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import taglib
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+
+def read_files(paths, io, repeat):
+    for _ in range(repeat):
+        for path in paths:
+            try:
+                with taglib.File(path, io=io) as f:
+                    _ = f.tags, f.length
+            except OSError:
+                pass
+
+
+def wall_time(paths, io, repeat):
+    start = time.perf_counter()
+    read_files(paths, io, repeat)
+    return time.perf_counter() - start
+
+
+def syscall_count(paths, io):
+    """Count the system calls made by a child process that imports taglib and reads *paths*."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "strace.txt"
+        subprocess.run(
+            ["strace", "-f", "-c", "-o", str(output), sys.executable, __file__, "--child", io,
+             *map(str, paths)],
+            check=True,
+        )
+        for line in output.read_text().splitlines():
+            parts = line.split()
+            if parts and parts[-1] == "total":
+                return int(parts[3])
+    raise RuntimeError("could not parse strace output")
+
+
+def syscalls_per_file(paths, io):
+    baseline = syscall_count([], io)
+    return (syscall_count(paths, io) - baseline) / len(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", type=Path, help="files to read (default: test data)")
+    parser.add_argument("--repeat", type=int, default=100, help="number of times each file is read")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        read_files(args.files, args.child, repeat=1)
+        return
+    paths = args.files or sorted(p for p in DATA_DIR.iterdir() if p.is_file())
+
+    results = {}
+    for io in ("stream", "mmap"):
+        seconds = wall_time(paths, io, args.repeat)
+        results[io] = {"seconds_per_file": seconds / (args.repeat * len(paths))}
+    if shutil.which("strace"):
+        for io in ("stream", "mmap"):
+            results[io]["syscalls_per_file"] = syscalls_per_file(paths, io)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+"""pytest-benchmark suite measuring pytaglib's main operations per format.
+
+Each benchmark round processes a batch of files from the synthetic corpus (see ``corpus.py``),
+so timings are per batch; ``extra_info`` records the batch size. Run with::
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+from itertools import cycle
+
+import pytest
+
+import taglib
+from corpus import FORMATS
+
+# number of files processed per round in the per-file benchmarks
+BATCH = 50
+
+pytestmark = pytest.mark.parametrize("fmt", FORMATS)
+
+
+def open_batch(paths):
+    return [taglib.File(path) for path in paths]
+
+
+def close_batch(files):
+    for f in files:
+        f.close()
+
+
+def test_open(benchmark, corpus, fmt):
+    paths = corpus[fmt][:BATCH]
+    benchmark.extra_info["files"] = len(paths)
+    benchmark(lambda: close_batch(open_batch(paths)))
+
+
+def test_open_read_style_none(benchmark, corpus, fmt):
+    paths = corpus[fmt][:BATCH]
+    benchmark.extra_info["files"] = len(paths)
+    benchmark(lambda: close_batch([taglib.File(path, read_style="none") for path in paths]))
+
+
+def test_tags(benchmark, corpus, fmt):
+    paths = corpus[fmt][:BATCH]
+    benchmark.extra_info["files"] = len(paths)
+
+    def convert(files):
+        for f in files:
+            f.tags
+        close_batch(files)
+
+    benchmark.pedantic(convert, setup=lambda: ((open_batch(paths),), {}), rounds=20)
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_pictures(benchmark, corpus, fmt, copy):
+    paths = corpus[fmt][:BATCH]
+    benchmark.extra_info["files"] = len(paths)
+
+    def load(files):
+        for f in files:
+            f.get_pictures(copy=copy)
+        close_batch(files)
+
+    benchmark.pedantic(load, setup=lambda: ((open_batch(paths),), {}), rounds=20)
+
+
+def test_save(benchmark, writable_copies, fmt):
+    paths = writable_copies(fmt)
+    benchmark.extra_info["files"] = len(paths)
+    titles = cycle(["short title", "a somewhat longer title"])
+
+    def modified_files():
+        files = open_batch(paths)
+        title = next(titles)
+        for f in files:
+            f.tags["TITLE"] = [title]
+        return (files,), {}
+
+    def save(files):
+        for f in files:
+            f.save()
+        close_batch(files)
+
+    benchmark.pedantic(save, setup=modified_files, rounds=20)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_read_many(benchmark, corpus, fmt, workers):
+    paths = corpus[fmt]
+    benchmark.extra_info["files"] = len(paths)
+    benchmark.pedantic(lambda: list(taglib.read_many(paths, workers=workers)), rounds=5)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+"""Micro-benchmarks of the conversion between TagLib strings and Python str.
+
+Files with many tags (and values in several scripts) make the conversion dominate the time of
+reading ``File.tags`` and of ``File.save``.
+"""
+import itertools
+import shutil
+
+import pytest
+
+import taglib
+from corpus import TEMPLATES
+
+TAG_COUNT = 500
+
+SAMPLES = {
+    "ascii": "The Quick Brown Fox Jumps Over The Lazy Dog",
+    "latin1": "Grüße aus Köln, Ça va très bien",
+    "cjk": "日本語のタイトルと中文的标题",
+    "astral": "\U0001F3B5 Music \U0001F3B6 Notes \U0001F600",
+}
+
+
+@pytest.fixture(params=list(SAMPLES))
+def many_tags(request, tmp_path):
+    path = tmp_path / "many-tags.flac"
+    shutil.copyfile(TEMPLATES["flac"], path)
+    tags = {f"TAG{i}": [f"{SAMPLES[request.param]} {i}", f"{i}"] for i in range(TAG_COUNT)}
+    with taglib.File(path) as f:
+        f.tags = tags
+        f.save()
+    return path, tags
+
+
+def test_tags_conversion(benchmark, many_tags):
+    path, _ = many_tags
+    benchmark.extra_info["strings"] = 3 * TAG_COUNT
+
+    def convert(f):
+        f.tags
+        f.close()
+
+    benchmark.pedantic(convert, setup=lambda: ((taglib.File(path, read_style="none"),), {}), rounds=100)
+
+
+def test_save_conversion(benchmark, many_tags):
+    path, tags = many_tags
+    benchmark.extra_info["strings"] = 3 * TAG_COUNT
+    rounds = itertools.count()
+
+    def modified():
+        # alternate the values so that every save converts and writes all tags
+        suffix = " (even)" if next(rounds) % 2 == 0 else " (odd)"
+        f = taglib.File(path, read_style="none")
+        f.tags = {key: [value + suffix for value in values] for key, values in tags.items()}
+        return (f,), {}
+
+    def save(f):
+        assert f.save().written
+        f.close()
+
+    benchmark.pedantic(save, setup=modified, rounds=50)
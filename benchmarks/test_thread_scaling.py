@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+"""Speedup of reading files on a thread pool over reading them sequentially.
+
+These are wall-clock measurements, so they live here instead of in the test suite that runs on
+every (possibly emulated or single-core) wheel build. The speedup is recorded as a test property
+(see ``--junitxml``).
+"""
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import taglib
+from corpus import TEMPLATES
+
+# number of ID3v2 frames in the files parsed, so that TagLib's work dominates the Python code around it
+TAG_COUNT = 2000
+
+
+def available_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@pytest.fixture
+def heavy_files(tmp_path):
+    """MP3 files with thousands of ID3v2 frames."""
+    template = tmp_path / "template.mp3"
+    shutil.copyfile(TEMPLATES["mp3"], template)
+    with taglib.File(template) as f:
+        f.tags = {f"TAG{i}": [f"value {i} " * 10] for i in range(TAG_COUNT)}
+        f.save()
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"heavy{i}.mp3"
+        shutil.copyfile(template, path)
+        paths.append(path)
+    return paths
+
+
+def parse(path):
+    # tags are not accessed, so all the work happens in TagLib with the GIL released
+    with taglib.File(path, read_style="none"):
+        pass
+
+
+def read(path):
+    with taglib.File(path) as f:
+        return f.tags, f.length
+
+
+def measure_speedup(fn, paths, workers):
+    """Ratio of the times for calling ``fn`` on all paths sequentially and on a thread pool."""
+    fn(paths[0])  # warm up the page cache
+    start = time.perf_counter()
+    for path in paths:
+        fn(path)
+    sequential = time.perf_counter() - start
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        start = time.perf_counter()
+        list(pool.map(fn, paths))
+        threaded = time.perf_counter() - start
+    return sequential / threaded
+
+
+@pytest.mark.skipif(available_cpus() < 2, reason="requires at least two CPUs")
+def test_threaded_read_speedup(heavy_files, record_property):
+    workers = min(available_cpus(), 4)
+    speedup = measure_speedup(parse, heavy_files * 10, workers)
+    record_property("threads", workers)
+    record_property("speedup", round(speedup, 2))
+    # if the GIL were held while parsing, threads could at best match sequential reads (1.0x)
+    assert speedup > 1.3
+
+
+@pytest.mark.skipif(getattr(sys, "_is_gil_enabled", lambda: True)(),
+                    reason="requires a free-threaded Python build")
+@pytest.mark.skipif(available_cpus() < 4, reason="requires at least four CPUs")
+def test_free_threaded_read_speedup(heavy_files, record_property):
+    # without the GIL, converting the tags to Python objects runs in parallel, too
+    workers = min(available_cpus(), 8)
+    speedup = measure_speedup(read, heavy_files * 10, workers)
+    record_property("threads", workers)
+    record_property("speedup", round(speedup, 2))
+    assert speedup > 1.5
@@ -51,7 +51,13 @@ setup(
         [
             Extension(
                 "taglib",
-                [str(src / "taglib.pyx"), str(src / "fileref_factory.cpp")],
+                [
+                    str(src / "taglib.pyx"),
+                    str(src / "fileref_factory.cpp"),
+                    str(src / "pyiostream.cpp"),
+                    str(src / "bufferstream.cpp"),
+                    str(src / "format_info.cpp"),
+                ],
                 **extension_kwargs(),
             )
         ],
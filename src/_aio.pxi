@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+
+
+async def _aiter_items(items):
+    """Iterate over a synchronous or asynchronous iterable."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class _AsyncModule(ModuleType):
+    """Asynchronous interface to pytaglib for use with asyncio.
+
+    The blocking TagLib operations are run on worker threads, so they don't block the event
+    loop. Since TagLib releases the GIL while parsing and saving, the threads run in parallel.
+
+    Note that a file operation that already started on a worker thread cannot be interrupted: if
+    the awaiting task is cancelled, the operation still completes in the background, but its
+    result is discarded.
+
+    Example:
+        ::
+
+            from taglib import aio
+
+            result = await aio.read('/path/to/file.mp3')
+            await aio.save('/path/to/file.mp3', {'GENRE': ['Jazz']})
+            async for result in aio.read_many(paths, workers=8):
+                ...
+    """
+
+    @staticmethod
+    async def read(path: Path | str | bytes, read_style: str = 'average',
+                   keys: Optional[Iterable[str]] = None, io: str = 'stream') -> ReadResult:
+        """Read the tags and audio properties of a file.
+
+        Args:
+            path: The file to read.
+            read_style: Read style for audio properties, see ``File``.
+            keys: If given, read only these tags, see ``File``.
+            io: How the file is accessed ("stream" or "mmap"), see ``File``.
+
+        Returns:
+            A ``ReadResult`` with the file's metadata.
+
+        Raises:
+            OSError: If the file could not be read.
+        """
+        import asyncio
+        check_read_style(read_style)
+        check_io(io)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, partial(_read_one, path, read_style=read_style, keys=normalize_keys(keys), io=io))
+        if result.error is not None:
+            raise result.error
+        return result
+
+    @staticmethod
+    async def save(path: Path | str | bytes, tags: Optional[Mapping[str, Optional[list[str]]]] = None,
+                   pictures: Optional[Iterable[Picture]] = None) -> SaveResult:
+        """Update tags and/or pictures of a file.
+
+        Only the given tags are replaced; a value of None (or an empty list) removes the tag, and
+        all tags not mentioned are left unchanged. If nothing changes, the file is not written.
+
+        Args:
+            path: The file to modify.
+            tags: Dict mapping tag names to their new values.
+            pictures: If not None, replaces the embedded pictures.
+
+        Returns:
+            The ``SaveResult`` of ``File.save``.
+
+        Raises:
+            OSError: If the file could not be read or saved.
+        """
+        import asyncio
+        if pictures is not None:
+            pictures = list(pictures)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(_update_file, path, tags, pictures))
+
+    @staticmethod
+    async def read_many(
+            paths: Iterable[Path | str | bytes] | AsyncIterable[Path | str | bytes],
+            workers: Optional[int] = None,
+            ordered: bool = False,
+            read_style: str = 'average',
+            keys: Optional[Iterable[str]] = None,
+            io: str = 'stream',
+    ) -> AsyncIterator[ReadResult]:
+        """Asynchronously iterate over the metadata of many files, read in parallel.
+
+        This is the asynchronous version of ``taglib.read_many``. At most ``workers`` files are
+        read at the same time, and ``paths`` (which may also be an asynchronous iterable) is only
+        consumed as results are taken from the iterator, so a slow consumer holds back reading.
+        Files that cannot be read do not abort the iteration; their results have ``error`` set.
+        When the iteration is stopped early, pending reads are cancelled.
+
+        Args:
+            paths: The files to read.
+            workers: Maximum number of files read concurrently (default: number of CPUs).
+            ordered: If True, yield results in the order of ``paths``; otherwise, in completion order.
+            read_style: Read style for audio properties, see ``File``.
+            keys: If given, read only these tags, see ``File``.
+            io: How files are accessed ("stream" or "mmap"), see ``File``.
+
+        Yields:
+            A ``ReadResult`` for each of the given paths.
+        """
+        import asyncio
+        check_read_style(read_style)
+        check_io(io)
+        workers = workers or os.cpu_count() or 1
+        read = partial(_read_one, read_style=read_style, keys=normalize_keys(keys), io=io)
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pending = deque()
+
+        async def take_result() -> ReadResult:
+            """Wait for the next result to yield and remove it from ``pending``."""
+            if ordered:
+                await asyncio.wait([pending[0][1]])
+                path, future = pending.popleft()
+            else:
+                await asyncio.wait([future for _, future in pending], return_when=asyncio.FIRST_COMPLETED)
+                path, future = next(entry for entry in pending if entry[1].done())
+                pending.remove((path, future))
+            try:
+                return future.result()
+            except Exception as e:
+                return ReadResult(path=as_path(path), error=e)
+
+        try:
+            async for path in _aiter_items(paths):
+                if len(pending) >= workers:
+                    yield await take_result()
+                pending.append((path, loop.run_in_executor(pool, read, path)))
+            while pending:
+                yield await take_result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+aio = _AsyncModule('taglib.aio', _AsyncModule.__doc__)
+sys.modules[aio.__name__] = aio
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+
+
+@dataclass(slots=True)
+class ReadResult:
+    """Metadata of a single file read by :func:`read_many`.
+
+    If the file could not be read, ``error`` holds the exception that occurred and all other
+    attributes except ``path`` are None. The audio properties are None as well if the file was
+    read with ``read_style="none"``.
+
+    Attributes:
+        path: Path to the audio file.
+        tags: Dict mapping tag names to lists of tag values (see ``File.tags``).
+        unsupported: List of unsupported property identifiers (see ``File.unsupported``).
+        length: Length of the audio in seconds.
+        bitrate: Bitrate in kb/s.
+        sampleRate: Sample rate in Hz.
+        channels: Number of audio channels.
+        pictures: Summaries of the embedded pictures, without image data (only set if requested
+            with ``pictures=True``, and by ``CachedReader``).
+        error: The exception raised while reading the file, if any.
+    """
+    path: Path
+    tags: Optional[dict[str, list[str]]] = None
+    unsupported: Optional[list[str]] = None
+    length: Optional[float] = None
+    bitrate: Optional[int] = None
+    sampleRate: Optional[int] = None
+    channels: Optional[int] = None
+    pictures: Optional[list[PictureInfo]] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was read successfully."""
+        return self.error is None
+
+
+def _read_one(path, read_style: str = 'average', keys: Optional[tuple] = None,
+              io: str = 'stream', pictures: bool = False) -> ReadResult:
+    """Read a single file for ``read_many``. Module-level so that process pools can pickle it.
+
+    If ``pictures`` is true, picture summaries (without image data) are read as well.
+    """
+    path = as_path(path)
+    try:
+        with File(path, read_style=read_style, keys=keys, io=io) as f:
+            result = ReadResult(path=path, tags=f.tags, unsupported=f.unsupported)
+            if read_style != 'none':
+                result.length = f.length
+                result.bitrate = f.bitrate
+                result.sampleRate = f.sampleRate
+                result.channels = f.channels
+            if pictures:
+                result.pictures = [replace(info, _view=None) for info in f.picture_info]
+            return result
+    except Exception as e:
+        return ReadResult(path=path, error=e)
+
+
+cdef object make_executor(str executor, workers):
+    if executor == 'thread':
+        return ThreadPoolExecutor(max_workers=workers)
+    if executor == 'process':
+        # imported here because it loads multiprocessing, which only process pools need
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=workers)
+    raise ValueError(f'executor must be "thread" or "process", not {executor!r}')
+
+
+def _imap(pool, fn, items: Iterable, Py_ssize_t window, bint ordered):
+    """Submit ``fn(item)`` for each of ``items`` to ``pool`` and yield ``(item, future)`` pairs
+    of completed futures.
+
+    At most ``window`` futures are pending at any time, so ``items`` is consumed lazily and may be
+    arbitrarily long. If ``ordered`` is true, results are yielded in input order, otherwise in
+    completion order. Pending futures are cancelled when the generator is closed early.
+    """
+    cdef bint exhausted = False
+    items = iter(items)
+    pending = deque()
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                else:
+                    pending.append((item, pool.submit(fn, item)))
+            if not pending:
+                return
+            if ordered:
+                item, future = pending[0]
+                wait([future])
+                pending.popleft()
+                yield item, future
+            else:
+                done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                for item, future in [entry for entry in pending if entry[1] in done]:
+                    pending.remove((item, future))
+                    yield item, future
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def read_many(
+        paths: Iterable[Path | str | bytes],
+        workers: Optional[int] = None,
+        executor: str = 'thread',
+        ordered: bool = False,
+        read_style: str = 'average',
+        keys: Optional[Iterable[str]] = None,
+        io: str = 'stream',
+        pictures: bool = False,
+) -> Iterator[ReadResult]:
+    """Read the tags and audio properties of many files in parallel.
+
+    Results are streamed back as they become available; ``paths`` is consumed lazily, so it may be
+    a generator over a very large number of files. A file that cannot be read does not abort the
+    batch; instead, the corresponding result has its ``error`` attribute set.
+
+    Args:
+        paths: The files to read.
+        workers: Number of worker threads or processes (default: number of CPUs).
+        executor: Either "thread" or "process".
+        ordered: If True, yield results in the order of ``paths``; otherwise, in completion order.
+        read_style: Read style for audio properties, see ``File``.
+        keys: If given, read only these tags, see ``File``.
+        io: How files are accessed ("stream" or "mmap"), see ``File``.
+        pictures: If True, also read summaries of the embedded pictures (``ReadResult.pictures``).
+
+    Yields:
+        A ``ReadResult`` for each of the given paths.
+
+    Example:
+        ::
+
+            for result in taglib.read_many(paths, workers=8):
+                if result.ok:
+                    print(result.path, result.tags.get('TITLE'))
+                else:
+                    print(f'failed to read {result.path}: {result.error}')
+    """
+    check_read_style(read_style)
+    check_io(io)
+    workers = workers or os.cpu_count() or 1
+    read = partial(_read_one, read_style=read_style, keys=normalize_keys(keys), io=io,
+                   pictures=pictures)
+    pool = make_executor(executor, workers)
+    try:
+        for path, future in _imap(pool, read, paths, 4 * workers, ordered):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = ReadResult(path=as_path(path), error=e)
+            yield result
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _update_file(path, tags: Optional[Mapping[str, Optional[list[str]]]] = None,
+                 pictures: Optional[Iterable[Picture]] = None) -> SaveResult:
+    """Apply a partial update to the file at ``path`` and save it.
+
+    Only the tags in ``tags`` are read and replaced; a value of None (or an empty list) removes
+    the tag. All other tags are left unchanged. If ``pictures`` is not None, it replaces the
+    embedded pictures.
+    """
+    tags = normalize_tags(dict(tags), True) if tags else {}
+    with File(path, read_style='none', keys=tags.keys()) as f:
+        for key in f.keys:
+            f.tags[key] = tags.get(key, [])
+        if pictures is not None:
+            f.pictures = pictures
+        return f.save()
+
+
+cdef frozenset normalize_extensions(extensions):
+    """Convert an iterable of file name extensions (with or without leading dot) to a set of
+    lower-case extensions without dot."""
+    if extensions is None:
+        return supported_extensions()
+    if isinstance(extensions, str):
+        extensions = [extensions]
+    return frozenset(extension.lower().lstrip('.') for extension in extensions)
+
+
+def _iter_files(root, frozenset extensions, bint recursive):
+    """Yield the paths of all files below ``root`` with one of the given extensions.
+
+    Directories are walked depth-first with ``os.scandir``, keeping one open directory iterator
+    per level, so memory does not grow with the number of files. Like ``os.walk``, directories
+    that cannot be listed are skipped, and symbolic links to directories are not followed.
+    """
+    stack = [os.scandir(root)]
+    try:
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop().close()
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(os.scandir(entry.path))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            extension = os.path.splitext(entry.name)[1]
+            if extension[1:].lower() in extensions:
+                yield entry.path
+    finally:
+        for iterator in stack:
+            iterator.close()
+
+
+def scan(
+        root: Path | str | bytes,
+        extensions: Optional[Iterable[str]] = None,
+        recursive: bool = True,
+        workers: Optional[int] = None,
+        executor: str = 'thread',
+        read_style: str = 'average',
+        keys: Optional[Iterable[str]] = None,
+        io: str = 'stream',
+        pictures: bool = False,
+) -> Iterator[ReadResult]:
+    """Read the metadata of all audio files in a directory tree in parallel.
+
+    Only files whose extension is supported by TagLib (or listed in ``extensions``) are read, so
+    other files are skipped without trying to open them. The directory tree is walked lazily while
+    files are read, so memory use does not depend on the size of the tree.
+
+    Args:
+        root: The directory to scan.
+        extensions: File name extensions to read (default: ``supported_extensions()``).
+        recursive: If False, only scan files directly in ``root``.
+        workers: Number of worker threads or processes (default: number of CPUs).
+        executor: Either "thread" or "process".
+        read_style: Read style for audio properties, see ``File``.
+        keys: If given, read only these tags, see ``File``.
+        io: How files are accessed ("stream" or "mmap"), see ``File``.
+        pictures: If True, also read summaries of the embedded pictures (``ReadResult.pictures``).
+
+    Yields:
+        A ``ReadResult`` for each audio file found, in completion order.
+
+    Raises:
+        OSError: If ``root`` cannot be listed.
+
+    Example:
+        ::
+
+            for result in taglib.scan('/music', keys=['ARTIST', 'TITLE']):
+                print(result.path, result.tags)
+    """
+    if isinstance(root, bytes):
+        root = root.decode('utf-8')
+    files = _iter_files(os.fspath(root), normalize_extensions(extensions), recursive)
+    yield from read_many(files, workers=workers, executor=executor, read_style=read_style,
+                         keys=keys, io=io, pictures=pictures)
+
+
+@dataclass(slots=True)
+class WriteResult:
+    """Outcome of updating a single file with :func:`write_many`.
+
+    Attributes:
+        path: Path to the audio file.
+        unsaved: Tags that could not be stored because the format does not support them (see the
+            return value of ``File.save``); None if an error occurred.
+        written: Whether the file was actually written (False if nothing changed).
+        in_place: Whether the file kept its size, so that only the tags were overwritten (see
+            ``SaveResult.in_place``); None if the file was not written.
+        elapsed: Time in seconds spent on the file, including opening and saving it.
+        error: The exception raised while updating the file, if any.
+    """
+    path: Path
+    unsaved: Optional[dict[str, list[str]]] = None
+    written: bool = False
+    in_place: Optional[bool] = None
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was updated successfully."""
+        return self.error is None
+
+
+def _write_one(tuple item) -> WriteResult:
+    """Update a single file for ``write_many``. Module-level so that process pools can pickle it."""
+    path, tags, pictures = item
+    path = as_path(path)
+    start = time.perf_counter()
+    try:
+        saved = _update_file(path, tags, pictures)
+    except Exception as e:
+        return WriteResult(path=path, elapsed=time.perf_counter() - start, error=e)
+    return WriteResult(path=path, unsaved=dict(saved), written=saved.written,
+                       in_place=saved.in_place, elapsed=time.perf_counter() - start)
+
+
+def write_many(
+        changes: Mapping[Path | str | bytes, Mapping[str, Optional[list[str]]]]
+                 | Iterable[tuple[Path | str | bytes, Mapping[str, Optional[list[str]]]]],
+        pictures: Optional[Mapping[Path | str | bytes, Iterable[Picture]]] = None,
+        workers: Optional[int] = None,
+        executor: str = 'thread',
+        ordered: bool = False,
+) -> Iterator[WriteResult]:
+    """Update the tags (and optionally pictures) of many files in parallel.
+
+    Each file is updated partially: only the tags given for it are replaced; a value of None (or
+    an empty list) removes the tag, and all other tags are left unchanged. Files whose tags would
+    not change are not written. A file that cannot be updated does not abort the batch; instead,
+    the corresponding result has its ``error`` attribute set.
+
+    Args:
+        changes: Dict (or iterable of pairs) mapping paths to the tags to change in that file.
+            ``changes`` is consumed lazily, so it may be a generator over a very large number of files.
+        pictures: Dict mapping paths to the pictures that replace the embedded pictures of that
+            file. Only files in ``changes`` are modified; use an empty tag dict to change only
+            the pictures of a file.
+        workers: Number of worker threads or processes (default: number of CPUs).
+        executor: Either "thread" or "process".
+        ordered: If True, yield results in the order of ``changes``; otherwise, in completion order.
+
+    Yields:
+        A ``WriteResult`` for each of the changed files.
+
+    Example:
+        ::
+
+            changes = {path: {'GENRE': ['Jazz'], 'COMMENT': None} for path in jazz_files}
+            for result in taglib.write_many(changes, workers=8):
+                if not result.ok:
+                    print(f'failed to update {result.path}: {result.error}')
+    """
+    if isinstance(changes, Mapping):
+        changes = changes.items()
+    if pictures is not None:
+        pictures = {as_path(path): list(pics) for path, pics in pictures.items()}
+    items = ((path, tags, pictures.get(as_path(path)) if pictures else None)
+             for path, tags in changes)
+    workers = workers or os.cpu_count() or 1
+    pool = make_executor(executor, workers)
+    try:
+        for item, future in _imap(pool, _write_one, items, 4 * workers, ordered):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = WriteResult(path=as_path(item[0]), error=e)
+            yield result
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+
+
+_CACHE_SCHEMA = '''
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    read_style TEXT NOT NULL,
+    data TEXT NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+'''
+
+# fields of PictureInfo stored in the cache (all except the image data)
+_PICTURE_FIELDS = ('mime_type', 'description', 'picture_type', 'width', 'height', 'size')
+
+# number of cache hits whose last_used time is kept in memory before it is written
+_USED_BATCH_SIZE = 1000
+
+# open CachedReaders, notified by File.save
+_caches = weakref.WeakSet()
+
+
+cdef void invalidate_caches(path):
+    """Remove ``path`` from all open ``CachedReader`` databases.
+
+    Errors (e.g. a cache closed concurrently, or a locked database) are ignored, so that they do
+    not fail the save that triggered the invalidation; a stale entry would still be detected by
+    the changed size, mtime or inode of the file.
+    """
+    for cache in list(_caches):
+        try:
+            cache.invalidate(path)
+        except Exception:
+            pass
+
+
+cdef str result_to_json(result):
+    return json.dumps({
+        'tags': result.tags,
+        'unsupported': result.unsupported,
+        'length': result.length,
+        'bitrate': result.bitrate,
+        'sampleRate': result.sampleRate,
+        'channels': result.channels,
+        'pictures': [{name: getattr(info, name) for name in _PICTURE_FIELDS}
+                     for info in result.pictures],
+    }, ensure_ascii=False)
+
+
+cdef object result_from_json(path, str data):
+    cdef dict d = json.loads(data)
+    d['pictures'] = [PictureInfo(**info) for info in d['pictures']]
+    return ReadResult(path=path, **d)
+
+
+class CachedReader:
+    """Read metadata of audio files through a persistent cache in an SQLite database.
+
+    Tags, audio properties and picture summaries (see ``ReadResult.pictures``) are stored per file
+    together with its size, modification time and inode. A cached entry is used as long as these
+    are unchanged, so re-reading an unmodified file costs only a ``stat()`` call and a database
+    lookup. Files that cannot be read are not cached.
+
+    The least recently used order is tracked in memory for cache hits and written in batches (and
+    on ``commit`` and ``close``), so reading cached files does not write to the database each time.
+
+    Entries are removed automatically when a file is saved with ``File.save`` in the same process.
+    If the cache grows beyond ``max_entries``, the least recently used entries are evicted.
+
+    A CachedReader may be used from multiple threads. Use it as a context manager, or call
+    ``close()`` when done, to make sure all changes are written to the database.
+
+    Args:
+        db_path: Path of the SQLite database file; created if it does not exist.
+        max_entries: Maximum number of files kept in the cache.
+        read_style: Read style for audio properties, see ``File``.
+
+    Example:
+        ::
+
+            with taglib.CachedReader('~/.cache/library.db') as cache:
+                for result in cache.read_many(paths, workers=8):
+                    print(result.path, result.tags.get('TITLE'))
+    """
+
+    def __init__(self, db_path: Path | str, max_entries: int = 1_000_000, read_style: str = 'average'):
+        import sqlite3
+        check_read_style(read_style)
+        if max_entries < 1:
+            raise ValueError(f'max_entries must be positive, not {max_entries}')
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.read_style = read_style
+        self._lock = threading.Lock()
+        self._used = {}
+        self._db = sqlite3.connect(os.path.expanduser(db_path), check_same_thread=False)
+        self._db.executescript(_CACHE_SCHEMA)
+        self._count, self._clock = self._db.execute(
+            'SELECT COUNT(*), COALESCE(MAX(last_used), 0) FROM entries').fetchone()
+        _caches.add(self)
+
+    def read(self, path: Path | str | bytes) -> ReadResult:
+        """Read the metadata of a file, from the cache if the file is unchanged.
+
+        Args:
+            path: The file to read.
+
+        Returns:
+            A ``ReadResult`` with ``pictures`` set; if the file could not be read, its ``error``
+            attribute is set.
+        """
+        result = self._read(path)
+        with self._lock:
+            # write a new entry, but keep the usage of a cache hit in memory
+            self._check_open()
+            self._db.commit()
+        return result
+
+    def read_many(self, paths: Iterable[Path | str | bytes], workers: Optional[int] = None,
+                  ordered: bool = False) -> Iterator[ReadResult]:
+        """Read the metadata of many files in parallel, using the cache for unchanged files.
+
+        Works like ``taglib.read_many``, using a thread pool.
+
+        Args:
+            paths: The files to read.
+            workers: Number of worker threads (default: number of CPUs).
+            ordered: If True, yield results in the order of ``paths``; otherwise, in completion order.
+
+        Yields:
+            A ``ReadResult`` for each of the given paths. Errors, including those of the cache
+            database and of a cache closed during the iteration, are reported in ``error``.
+        """
+        cdef Py_ssize_t count = 0
+        workers = workers or os.cpu_count() or 1
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for path, future in _imap(pool, self._read, paths, 4 * workers, ordered):
+                count += 1
+                if count % 1000 == 0:
+                    self._commit_if_open()
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = ReadResult(path=as_path(path), error=e)
+                yield result
+        finally:
+            pool.shutdown(cancel_futures=True)
+            self._commit_if_open()
+
+    def invalidate(self, path: Path | str | bytes) -> None:
+        """Remove the entry of ``path`` from the cache, if any."""
+        key = os.path.abspath(as_path(path))
+        with self._lock:
+            self._check_open()
+            self._used.pop(key, None)
+            self._count -= self._db.execute('DELETE FROM entries WHERE path = ?', (key,)).rowcount
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._check_open()
+            self._db.execute('DELETE FROM entries')
+            self._db.commit()
+            self._used.clear()
+            self._count = 0
+
+    def commit(self) -> None:
+        """Write pending changes to the database."""
+        with self._lock:
+            self._check_open()
+            self._write_used()
+            self._db.commit()
+
+    def close(self) -> None:
+        """Write pending changes and close the database."""
+        with self._lock:
+            if self._db is None:
+                return
+            _caches.discard(self)
+            self._write_used()
+            self._db.commit()
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> 'CachedReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'CachedReader({self.db_path!r})'
+
+    def _check_open(self) -> None:
+        if self._db is None:
+            raise ValueError('CachedReader is closed')
+
+    def _commit_if_open(self) -> None:
+        """Like ``commit``, but do nothing if the cache was closed (which committed already)."""
+        with self._lock:
+            if self._db is not None:
+                self._write_used()
+                self._db.commit()
+
+    def _write_used(self) -> None:
+        """Write the last_used times of recent cache hits; the lock must be held."""
+        if self._used:
+            self._db.executemany('UPDATE entries SET last_used = ? WHERE path = ?',
+                                 [(used, key) for key, used in self._used.items()])
+            self._used.clear()
+
+    def _read(self, path) -> ReadResult:
+        path = as_path(path)
+        key = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            return ReadResult(path=path, error=e)
+        # the file is stat'ed before it is parsed: if it changes in between, the entry is stale
+        # right away, and the file is parsed again on the next read
+        stamp = (st.st_size, st.st_mtime_ns, st.st_ino, self.read_style)
+        with self._lock:
+            self._check_open()
+            row = self._db.execute(
+                'SELECT size, mtime_ns, inode, read_style, data FROM entries WHERE path = ?',
+                (key,)).fetchone()
+            if row is not None and row[:4] == stamp:
+                self._clock += 1
+                self._used[key] = self._clock
+                if len(self._used) >= _USED_BATCH_SIZE:
+                    self._write_used()
+                return result_from_json(path, row[4])
+        result = _read_one(path, read_style=self.read_style, pictures=True)
+        if result.ok:
+            self._store(key, stamp, result, row is None)
+        return result
+
+    def _store(self, str key, tuple stamp, result, bint new) -> None:
+        data = result_to_json(result)
+        with self._lock:
+            self._check_open()
+            self._clock += 1
+            self._used.pop(key, None)
+            self._db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)',
+                             (key, *stamp, data, self._clock))
+            if new:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._write_used()
+                # evict down to 90% so that eviction does not run on every new entry
+                self._db.execute(
+                    'DELETE FROM entries WHERE path IN '
+                    '(SELECT path FROM entries ORDER BY last_used LIMIT ?)',
+                    (self._count - self.max_entries * 9 // 10,))
+                self._count = self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
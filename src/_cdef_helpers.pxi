@@ -4,44 +4,117 @@
 # This program is free software; you can redistribute it and/or modify
 # it under the terms of the GNU General Public License version 3 as
 # published by the Free Software Foundation
+from cpython.buffer cimport PyBUF_SIMPLE, PyBUF_WRITABLE, PyBuffer_FillInfo, PyBuffer_Release, PyObject_GetBuffer
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize, PyUnicode_DecodeUTF16, PyUnicode_FromWideChar
+from libc.stddef cimport wchar_t
 from libcpp cimport bool as cppbool
 from libcpp.utility cimport pair
+from libcpp.vector cimport vector
 
-cdef str toStr(ctypes.String s):
-    """Converts TagLib::String to a Python str."""
-    return s.to8Bit(True).decode('UTF-8', 'replace')
+cdef str toStr(const ctypes.String& s):
+    """Converts TagLib::String to a Python str.
+
+    TagLib stores strings as UTF-16 code units (in a wchar_t array), which are converted to a str
+    directly. Unpaired surrogates are replaced by U+FFFD.
+    """
+    cdef:
+        const wchar_t* data = s.toCWString()
+        Py_ssize_t size = s.size()
+        Py_ssize_t i
+    for i in range(size):
+        if 0xD800 <= <unsigned int>data[i] <= 0xDFFF:
+            return utf16_to_str(data, size)
+    # without surrogates, code units and code points coincide for any size of wchar_t
+    return PyUnicode_FromWideChar(<wchar_t*>data, size)
+
+cdef str utf16_to_str(const wchar_t* data, Py_ssize_t size):
+    """Decode an array of UTF-16 code units that contains surrogates."""
+    cdef:
+        vector[char] buffer
+        int byteorder = -1  # little endian
+        Py_ssize_t i
+    buffer.resize(2 * size)
+    for i in range(size):
+        buffer[2 * i] = <char>(data[i] & 0xFF)
+        buffer[2 * i + 1] = <char>((data[i] >> 8) & 0xFF)
+    return PyUnicode_DecodeUTF16(buffer.data(), 2 * size, 'replace', &byteorder)
 
 cdef ctypes.String toCStr(value: str | bytes):
-    """Convert a Python string or bytes to TagLib::String"""
+    """Convert a Python string or bytes to TagLib::String
+
+    For str, the UTF-8 representation cached in the str object is used, which for ASCII strings is
+    the str's own data, so no intermediate bytes object is created.
+    """
+    cdef Py_ssize_t size
     if isinstance(value, str):
-        value = value.encode('UTF-8')
+        return ctypes.String(<char*>PyUnicode_AsUTF8AndSize(value, &size), ctypes.UTF8)
     return ctypes.String(value, ctypes.UTF8)
 
-cdef dict[str, str] propertyMapToDict(ctypes.PropertyMap map):
-    """Convert a TagLib::PropertyMap to a dict mapping unicode string to list of unicode strings."""
+cdef dict[str, str] propertyMapToDict(ctypes.PropertyMap& map, tuple keys = None):
+    """Convert a TagLib::PropertyMap to a dict mapping unicode string to list of unicode strings.
+
+    If ``keys`` is given, only those (upper-case) keys are converted; all others are skipped
+    without creating Python objects for them.
+    """
     cdef:
-        ctypes.StringList values
         pair[ctypes.String, ctypes.StringList] mapIter
+        ctypes.String cKey
         dict dct = {}
         str tag
+    if keys is not None:
+        for tag in keys:
+            cKey = toCStr(tag)
+            if map.contains(cKey):
+                dct[tag] = [toStr(value) for value in map[cKey]]
+        return dct
     for mapIter in map:
-        tag = toStr(mapIter.first)
-        dct[tag] = []
-        values = mapIter.second
-        for value in values:
-            dct[tag].append(toStr(value))
+        dct[toStr(mapIter.first)] = [toStr(value) for value in mapIter.second]
     return dct
 
-cdef bytes bytevector_to_bytes(ctypes.ByteVector bv):
+cdef bytes bytevector_to_bytes(const ctypes.ByteVector& bv):
     """Convert TagLib::ByteVector to Python bytes."""
     return bv.data()[:bv.size()]
 
-cdef ctypes.ByteVector bytes_to_bytevector(bytes data):
-    """Convert Python bytes to TagLib::ByteVector."""
-    return ctypes.ByteVector(data, len(data))
+cdef class ByteVectorBuffer:
+    """Read-only buffer exposing the data of a TagLib::ByteVector without copying it.
+
+    TagLib's ByteVector is implicitly shared, so the buffer holds a reference to the data
+    and stays valid even after the file it was read from has been closed or modified.
+    """
+    cdef ctypes.ByteVector bv
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError('ByteVector buffers are read-only')
+        PyBuffer_FillInfo(buffer, self, <void*>bytevector_data(self.bv), self.bv.size(), 1, flags)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+cdef const char* bytevector_data(const ctypes.ByteVector& bv):
+    """Return a pointer to the data of ``bv``; taking a const reference avoids a detaching copy."""
+    return bv.data()
+
+cdef memoryview bytevector_to_memoryview(const ctypes.ByteVector& bv):
+    """Wrap TagLib::ByteVector in a read-only memoryview without copying its data."""
+    cdef ByteVectorBuffer buffer = ByteVectorBuffer.__new__(ByteVectorBuffer)
+    buffer.bv = bv
+    return memoryview(buffer)
+
+cdef ctypes.ByteVector bytes_to_bytevector(object data):
+    """Convert Python bytes (or any other object supporting the buffer protocol) to TagLib::ByteVector."""
+    cdef Py_buffer view
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+    try:
+        return ctypes.ByteVector(<const char*>view.buf, view.len)
+    finally:
+        PyBuffer_Release(&view)
+
+cdef object variant_to_object(ctypes.Variant v, bint copy = True):
+    """Convert a TagLib::Variant to a Python object.
 
-cdef object variant_to_object(ctypes.Variant v):
-    """Convert a TagLib::Variant to a Python object."""
+    If ``copy`` is false, binary data is returned as a memoryview instead of bytes.
+    """
     cdef:
         cppbool ok = False
     if v.type() == ctypes.Void:
@@ -55,28 +128,32 @@ cdef object variant_to_object(ctypes.Variant v):
     elif v.type() == ctypes.VString:
         return toStr(v.toString(&ok))
     elif v.type() == ctypes.VByteVector:
-        return bytevector_to_bytes(v.toByteVector(&ok))
+        if stats_enabled:
+            count_complex_property_bytes(v.toByteVector(&ok).size())
+        if copy:
+            return bytevector_to_bytes(v.toByteVector(&ok))
+        return bytevector_to_memoryview(v.toByteVector(&ok))
     elif v.type() == ctypes.VVariantMap:
-        return variant_map_to_dict(v.toMap(&ok))
+        return variant_map_to_dict(v.toMap(&ok), copy)
     else:
         return None
 
-cdef dict variant_map_to_dict(ctypes.VariantMap vm):
+cdef dict variant_map_to_dict(ctypes.VariantMap vm, bint copy = True):
     """Convert a TagLib::VariantMap to a Python dict."""
     cdef:
         pair[ctypes.String, ctypes.Variant] mapIter
         dict result = {}
     for mapIter in vm:
-        result[toStr(mapIter.first)] = variant_to_object(mapIter.second)
+        result[toStr(mapIter.first)] = variant_to_object(mapIter.second, copy)
     return result
 
-cdef list variant_map_to_list(ctypes.List[ctypes.VariantMap] vl):
+cdef list variant_map_to_list(ctypes.List[ctypes.VariantMap] vl, bint copy = True):
     """Convert a TagLib::List<VariantMap> to a Python list of dicts."""
     cdef:
         ctypes.VariantMap vm
         list result = []
     for vm in vl:
-        result.append(variant_map_to_dict(vm))
+        result.append(variant_map_to_dict(vm, copy))
     return result
 
 cdef ctypes.Variant object_to_variant(object obj):
@@ -98,7 +175,7 @@ cdef ctypes.Variant object_to_variant(object obj):
     elif isinstance(obj, str):
         cstr = toCStr(obj)
         return ctypes.Variant(cstr)
-    elif isinstance(obj, bytes):
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
         bv = bytes_to_bytevector(obj)
         return ctypes.Variant(bv)
     elif isinstance(obj, dict):
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+
+
+# number of bytes at the start of a file inspected by detect_format
+_HEADER_SIZE = 4096
+
+_ASF_GUID = bytes.fromhex('3026b2758e66cf11a6d900aa0062ce6c')
+_MOD_SIGNATURES = frozenset([b'M.K.', b'M!K!', b'M&K!', b'N.T.', b'FLT4', b'FLT8', b'CD81', b'OKTA',
+                             b'4CHN', b'6CHN', b'8CHN', b'16CH', b'32CH'])
+# formats whose data may be preceded by an ID3v2 tag
+_ID3_FORMATS = frozenset(['MPEG', 'FLAC', 'APE', 'MPC', 'TrueAudio'])
+
+
+cdef object sniff(bytes head):
+    """Identify a file format by the signature at the start of ``head``; None if unknown."""
+    if head.startswith(b'fLaC'):
+        return 'FLAC'
+    if head.startswith(b'OggS'):
+        return sniff_ogg(head)
+    if head[4:8] == b'ftyp':
+        return 'MP4'
+    if head.startswith(b'RIFF') and head[8:12] == b'WAVE':
+        return 'WAV'
+    if head.startswith(b'FORM') and head[8:12] in (b'AIFF', b'AIFC'):
+        return 'AIFF'
+    if head.startswith(b'MAC '):
+        return 'APE'
+    if head.startswith(b'wvpk'):
+        return 'WavPack'
+    if head.startswith(_ASF_GUID):
+        return 'ASF'
+    if head.startswith((b'MPCK', b'MP+')):
+        return 'MPC'
+    if head.startswith(b'TTA1'):
+        return 'TrueAudio'
+    if head.startswith(b'IMPM'):
+        return 'IT'
+    if head[44:48] == b'SCRM':
+        return 'S3M'
+    if head.startswith(b'Extended Module: '):
+        return 'XM'
+    if is_mpeg_frame(head):
+        return 'MPEG'
+    if head[1080:1084] in _MOD_SIGNATURES:
+        return 'MOD'
+    return None
+
+
+cdef object sniff_ogg(bytes head):
+    """Identify the codec of an Ogg stream by the first packet of its first page."""
+    if len(head) < 27:
+        return None
+    cdef Py_ssize_t start = 27 + head[26]
+    packet = head[start:start + 8]
+    if packet.startswith(b'\x01vorbis'):
+        return 'OggVorbis'
+    if packet.startswith(b'OpusHead'):
+        return 'OggOpus'
+    if packet.startswith((b'\x7fFLAC', b'fLaC')):
+        return 'OggFLAC'
+    if packet.startswith(b'Speex   '):
+        return 'OggSpeex'
+    return None
+
+
+cdef bint is_mpeg_frame(bytes head):
+    """Check if ``head`` starts with an MPEG audio frame header (layer I, II or III)."""
+    if len(head) < 4 or head[0] != 0xFF or (head[1] & 0xE0) != 0xE0:
+        return False
+    return (head[1] & 0x18) != 0x08 and (head[1] & 0x06) != 0 and (head[2] & 0xF0) != 0xF0 \
+        and (head[2] & 0x0C) != 0x0C
+
+
+cdef Py_ssize_t id3v2_size(bytes head):
+    """Size of the ID3v2 tag at the start of ``head`` including header and footer, or 0 if none."""
+    if len(head) < 10 or not head.startswith(b'ID3'):
+        return 0
+    cdef Py_ssize_t size = (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14 | (head[8] & 0x7F) << 7 \
+                          | (head[9] & 0x7F)
+    return 10 + size + (10 if head[5] & 0x10 else 0)
+
+
+cdef bytes read_at(source, data, Py_ssize_t offset, Py_ssize_t size):
+    """Read up to ``size`` bytes at ``offset`` of ``data`` (if not None), a file object or a path."""
+    if data is not None:
+        return bytes(memoryview(data)[offset:offset + size])
+    if is_fileobj(source):
+        position = source.tell()
+        try:
+            source.seek(offset)
+            return source.read(size)
+        finally:
+            source.seek(position)
+    with open(as_path(source), 'rb') as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+def detect_format(source: Path | str | bytes | BinaryIO | None = None, *,
+                  data: Optional[bytes | bytearray | memoryview] = None) -> Optional[str]:
+    """Detect the format of an audio file from its content, without parsing it.
+
+    Only the first few KB of the file are read (plus a few bytes after an ID3v2 tag at the start),
+    so this is much cheaper than opening a ``File``, e.g. to filter or route files before reading
+    them. As only signatures are checked, a detected file might still be unreadable.
+
+    Args:
+        source: Path of the file (as everywhere in pytaglib, bytes are a UTF-8 encoded path), or
+            a seekable binary file object (its position is restored).
+        data: The file's content (at least its beginning) as a bytes-like object, instead of
+            ``source``.
+
+    Returns:
+        The name of the format, using the same names as ``AudioInfo.format`` ("MPEG", "FLAC",
+        "OggVorbis", "MP4", "WAV", ...), or None if the format is not recognized.
+
+    Raises:
+        OSError: If the file cannot be read.
+        TypeError: If not exactly one of ``source`` and ``data`` is given.
+    """
+    if (source is None) == (data is None):
+        raise TypeError('detect_format() requires either source or data')
+    head = read_at(source, data, 0, _HEADER_SIZE)
+    cdef Py_ssize_t offset = id3v2_size(head)
+    if offset == 0:
+        return sniff(head)
+    # an ID3v2 tag is followed by MPEG frames (or the signature of another format)
+    name = sniff(head[offset:] if offset + 64 <= len(head) else read_at(source, data, offset, 64))
+    return name if name in _ID3_FORMATS else 'MPEG'
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+
+
+# target file name extensions of the export formats
+_export_formats = {
+    '.csv': 'csv',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+    '.parquet': 'parquet',
+}
+
+
+def _iter_sources(sources: Iterable[Path | str | bytes]) -> Iterator[Path | str | bytes]:
+    """Yield the given paths, replacing directories by the audio files below them."""
+    cdef frozenset extensions = supported_extensions()
+    for source in sources:
+        if os.path.isdir(source):
+            if isinstance(source, bytes):
+                source = source.decode('utf-8')
+            yield from _iter_files(os.fspath(source), extensions, True)
+        else:
+            yield source
+
+
+cdef object import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError('Arrow and Parquet export require pyarrow (pip install pytaglib[arrow])') from e
+    return pyarrow
+
+
+class _ExportModule(ModuleType):
+    """Export the metadata of many audio files to columnar formats: CSV, Arrow IPC or Parquet.
+
+    Files are read in parallel and rows are written in chunks as files are read, so memory use does
+    not depend on the number of files. Arrow and Parquet output requires the optional ``pyarrow``
+    package.
+
+    Each row contains the ``path``, one column per selected tag, the audio properties ``length``,
+    ``bitrate``, ``sampleRate`` and ``channels``, and an ``error`` message for files that could
+    not be read. Tags with multiple values are stored as lists in Arrow and Parquet, and joined
+    with ``"; "`` in CSV.
+
+    The ``taglib-export`` command-line script exposes the same functionality.
+
+    Example:
+        ::
+
+            from taglib import export
+
+            export.write(['/music'], 'library.parquet', keys=['ARTIST', 'ALBUM', 'TITLE'])
+    """
+
+    DEFAULT_KEYS = ('ARTIST', 'ALBUMARTIST', 'ALBUM', 'TITLE', 'TRACKNUMBER', 'DISCNUMBER', 'DATE', 'GENRE')
+    PROPERTIES = ('length', 'bitrate', 'sampleRate', 'channels')
+
+    @staticmethod
+    def rows(sources: Iterable[Path | str | bytes], keys: Iterable[str] = DEFAULT_KEYS,
+             workers: Optional[int] = None) -> Iterator[dict]:
+        """Read files in parallel and yield one row (a dict) per file, in completion order.
+
+        Args:
+            sources: Audio files and directories, which are searched recursively.
+            keys: The tags to export.
+            workers: Number of worker threads (default: number of CPUs).
+
+        Yields:
+            Dicts mapping column names to values; tag values are lists of strings, or None if the
+            tag is not present.
+        """
+        keys = [key.upper() for key in keys]
+        for result in read_many(_iter_sources(sources), workers=workers, keys=keys):
+            row = {'path': str(result.path)}
+            for key in keys:
+                row[key] = result.tags.get(key) if result.ok else None
+            for prop in _ExportModule.PROPERTIES:
+                row[prop] = getattr(result, prop)
+            row['error'] = None if result.ok else str(result.error)
+            yield row
+
+    @staticmethod
+    def write(sources: Iterable[Path | str | bytes], target: Path | str, format: Optional[str] = None,
+              keys: Iterable[str] = DEFAULT_KEYS, workers: Optional[int] = None,
+              chunk_size: int = 10_000) -> int:
+        """Export the metadata of audio files to ``target``.
+
+        Args:
+            sources: Audio files and directories, which are searched recursively.
+            target: The file to write.
+            format: "csv", "arrow" (Arrow IPC file) or "parquet"; by default, derived from the
+                extension of ``target`` (.csv, .arrow/.feather/.ipc, .parquet).
+            keys: The tags to export.
+            workers: Number of worker threads (default: number of CPUs).
+            chunk_size: Maximum number of rows held in memory before they are written.
+
+        Returns:
+            The number of rows (files) written.
+
+        Raises:
+            ValueError: If the format is unknown.
+            ImportError: If pyarrow is required but not installed.
+        """
+        if format is None:
+            format = _export_formats.get(os.path.splitext(target)[1].lower())
+            if format is None:
+                raise ValueError(f'cannot derive export format from file name {target}')
+        if format not in ('csv', 'arrow', 'parquet'):
+            raise ValueError(f'format must be "csv", "arrow" or "parquet", not {format!r}')
+        keys = [key.upper() for key in keys]
+        rows = _ExportModule.rows(sources, keys, workers)
+        if format == 'csv':
+            return _ExportModule._write_csv(rows, target, keys)
+        return _ExportModule._write_arrow(rows, target, keys, format, chunk_size)
+
+    @staticmethod
+    def _write_csv(rows: Iterator[dict], target, list keys) -> int:
+        import csv
+        cdef Py_ssize_t count = 0
+        with open(target, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, ['path', *keys, *_ExportModule.PROPERTIES, 'error'])
+            writer.writeheader()
+            for row in rows:
+                for key in keys:
+                    if row[key] is not None:
+                        row[key] = '; '.join(row[key])
+                writer.writerow(row)
+                count += 1
+        return count
+
+    @staticmethod
+    def _write_arrow(rows: Iterator[dict], target, list keys, str format, Py_ssize_t chunk_size) -> int:
+        pa = import_pyarrow()
+        schema = pa.schema([
+            ('path', pa.string()),
+            *[(key, pa.list_(pa.string())) for key in keys],
+            ('length', pa.float64()),
+            ('bitrate', pa.int32()),
+            ('sampleRate', pa.int32()),
+            ('channels', pa.int32()),
+            ('error', pa.string()),
+        ])
+        cdef Py_ssize_t count = 0
+        if format == 'parquet':
+            writer = pa.parquet.ParquetWriter(target, schema)
+        else:
+            writer = pa.ipc.new_file(target, schema)
+        with writer:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    writer.write_batch(pa.RecordBatch.from_pylist(chunk, schema=schema))
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                writer.write_batch(pa.RecordBatch.from_pylist(chunk, schema=schema))
+                count += len(chunk)
+        return count
+
+    @staticmethod
+    def script() -> None:
+        """Command-line interface for ``export.write``."""
+        import argparse
+        parser = argparse.ArgumentParser(
+            prog='taglib-export',
+            description='Export the metadata of audio files to CSV, Arrow IPC or Parquet.')
+        parser.add_argument('source', nargs='+', help='audio files or directories (searched recursively)')
+        parser.add_argument('-o', '--output', required=True,
+                            help='output file; the format is derived from its extension '
+                                 '(.csv, .arrow/.feather/.ipc, .parquet) unless --format is given')
+        parser.add_argument('-f', '--format', choices=['csv', 'arrow', 'parquet'], help='output format')
+        parser.add_argument('-k', '--keys', default=','.join(_ExportModule.DEFAULT_KEYS),
+                            help='comma-separated list of tags to export (default: %(default)s)')
+        parser.add_argument('-j', '--jobs', type=int, help='number of files to read in parallel')
+        parser.add_argument('--chunk-size', type=int, default=10_000,
+                            help='number of rows held in memory (default: %(default)s)')
+        args = parser.parse_args()
+        try:
+            count = _ExportModule.write(args.source, args.output, args.format, args.keys.split(','),
+                                        args.jobs, args.chunk_size)
+        except (ImportError, ValueError) as e:
+            parser.error(str(e))
+        print(f'exported {count} files to {args.output}', file=sys.stderr)
+
+
+export = _ExportModule('taglib.export', _ExportModule.__doc__)
+sys.modules[export.__name__] = export
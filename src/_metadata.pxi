@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+
+
+# interned tuples of tag names, shared by all Metadata objects with the same set of tags
+cdef dict _key_tuples = {}
+# maximum number of distinct tuples in _key_tuples, which is never pruned
+_MAX_KEY_TUPLES = 10_000
+
+
+cdef tuple intern_keys(tuple keys):
+    """Return the shared instance of the tuple ``keys``, whose elements are interned strings.
+
+    Once ``_MAX_KEY_TUPLES`` different tuples are shared, new ones are returned without being
+    added to the table, so that libraries with many custom tag combinations do not fill it up.
+    """
+    cdef tuple interned = _key_tuples.get(keys)
+    if interned is None:
+        interned = tuple([sys.intern(key) for key in keys])
+        if len(_key_tuples) < _MAX_KEY_TUPLES:
+            _key_tuples[interned] = interned
+    return interned
+
+
+class Metadata(Mapping):
+    """Compact snapshot of the tags and audio properties of a file.
+
+    Use this instead of ``File`` objects or ``File.tags`` dicts to keep the metadata of many files
+    in memory. A Metadata object does not reference the native TagLib file, and it needs much less
+    memory than a dict of lists: tag names are interned and their tuple is shared among all objects
+    with the same set of tags (for the first 10,000 distinct sets), and a single tag value is
+    stored without a list around it.
+
+    Metadata is a read-only mapping from (upper-case) tag names to values. A value is a ``str``
+    for tags with a single value, and a tuple of ``str`` for tags with multiple values; use
+    ``getlist(key)`` to always get a list, or ``tags`` for a dict as in ``File.tags``.
+
+    Attributes:
+        path: Path to the audio file as a string (None for files opened from file objects).
+        length: Length of the audio in seconds (None if audio properties were not read).
+        bitrate: Bitrate in kb/s.
+        sampleRate: Sample rate in Hz.
+        channels: Number of audio channels.
+
+    Example:
+        ::
+
+            library = [taglib.Metadata.from_result(result) for result in taglib.scan('/music')]
+            artists = {song.get('ARTIST') for song in library}
+    """
+    __slots__ = ('path', '_keys', '_values', 'length', 'bitrate', 'sampleRate', 'channels')
+
+    def __init__(self, path: Optional[Path | str], tags: Mapping[str, list[str]],
+                 length: Optional[float] = None, bitrate: Optional[int] = None,
+                 sampleRate: Optional[int] = None, channels: Optional[int] = None):
+        items = sorted((key.upper(), values) for key, values in tags.items() if values)
+        self.path = None if path is None else os.fspath(path)
+        self._keys = intern_keys(tuple([key for key, _ in items]))
+        self._values = tuple([values[0] if len(values) == 1 else tuple(values) for _, values in items])
+        self.length = length
+        self.bitrate = bitrate
+        self.sampleRate = sampleRate
+        self.channels = channels
+
+    @classmethod
+    def from_file(cls, file: File) -> 'Metadata':
+        """Create a snapshot of the current tags and audio properties of an open ``File``."""
+        properties = (None,) * 4
+        if file.read_style != 'none':
+            properties = (file.length, file.bitrate, file.sampleRate, file.channels)
+        return cls(file.path, file.tags, *properties)
+
+    @classmethod
+    def from_result(cls, result: ReadResult) -> 'Metadata':
+        """Create a snapshot from a result of ``read_many`` or ``scan``.
+
+        Raises:
+            ValueError: If the result holds an error.
+        """
+        if not result.ok:
+            raise ValueError(f'cannot create Metadata for unreadable file {result.path}: {result.error}')
+        return cls(result.path, result.tags, result.length, result.bitrate, result.sampleRate,
+                   result.channels)
+
+    @property
+    def tags(self) -> dict[str, list[str]]:
+        """A new dict mapping tag names to lists of values, as ``File.tags``."""
+        return {key: self.getlist(key) for key in self._keys}
+
+    def getlist(self, key: str) -> list[str]:
+        """The list of values of tag ``key`` (empty if the tag is not present)."""
+        value = self.get(key.upper())
+        if value is None:
+            return []
+        return [value] if isinstance(value, str) else list(value)
+
+    def __getitem__(self, key: str) -> str | tuple[str, ...]:
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Metadata):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _metadata, self._fields()
+
+    def _fields(self) -> tuple:
+        return (self.path, self._keys, self._values, self.length, self.bitrate, self.sampleRate,
+                self.channels)
+
+    def __repr__(self) -> str:
+        tags = ', '.join(f'{key}={value!r}' for key, value in zip(self._keys, self._values))
+        return f'Metadata({self.path!r}, {tags})'
+
+
+def _metadata(path, tuple keys, tuple values, length, bitrate, sampleRate, channels) -> Metadata:
+    """Restore a pickled ``Metadata`` object."""
+    cdef object metadata = Metadata.__new__(Metadata)
+    metadata.path = path
+    metadata._keys = intern_keys(keys)
+    metadata._values = values
+    metadata.length = length
+    metadata.bitrate = bitrate
+    metadata.sampleRate = sampleRate
+    metadata.channels = channels
+    return metadata
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+
+
+@dataclass(slots=True, frozen=True)
+class AudioInfo:
+    """Audio properties and format of a file, as returned by :func:`probe`.
+
+    Results of :func:`probe_many` for files that could not be read have ``error`` set and all
+    other attributes except ``path`` None.
+
+    Attributes:
+        path: Path to the audio file.
+        format: Name of the file format: "MPEG", "FLAC", "OggVorbis", "OggOpus", "OggFLAC",
+            "OggSpeex", "MP4", "WAV", "AIFF", "APE", "WavPack", "ASF", "MPC", "TrueAudio",
+            "MOD", "IT", "S3M", "XM", or "unknown".
+        codec: Name of the audio codec, e.g. "MPEG-1 Layer 3", "AAC", "ALAC" or "PCM"; None if
+            unknown.
+        length: Length of the audio in seconds.
+        bitrate: Bitrate in kb/s.
+        sampleRate: Sample rate in Hz.
+        channels: Number of audio channels.
+        bits_per_sample: Bits per sample; None for lossy formats and if not available.
+        error: The exception raised while reading the file, if any.
+    """
+    path: Path
+    format: Optional[str] = None
+    codec: Optional[str] = None
+    length: Optional[float] = None
+    bitrate: Optional[int] = None
+    sampleRate: Optional[int] = None
+    channels: Optional[int] = None
+    bits_per_sample: Optional[int] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was read successfully."""
+        return self.error is None
+
+
+def probe(path: Path | str | bytes, read_style: str = 'average') -> AudioInfo:
+    """Read only the audio properties and format of a file.
+
+    This is faster than reading them with ``File``, as no tags are converted to Python objects
+    (TagLib still parses them, though).
+
+    Args:
+        path: The file to read.
+        read_style: Read style for audio properties: "fast", "average" or "accurate".
+
+    Returns:
+        An ``AudioInfo`` describing the file.
+
+    Raises:
+        OSError: If the file could not be read, or has no audio properties.
+        ValueError: If read_style is invalid.
+    """
+    check_read_style(read_style)
+    if read_style == 'none':
+        raise ValueError('read_style "none" cannot be used to probe audio properties')
+    path = as_path(path)
+    cdef:
+        ctypes.FileRef* ref
+        ctypes.AudioProperties* properties
+        ctypes.FormatInfo info
+        double start = perf_counter() if stats_enabled else 0
+        bint valid
+    ref = ctypes.make_fileref(str(path), True, _read_styles[read_style])
+    try:
+        valid = ref is not NULL and ref.file() is not NULL and ref.file().isValid()
+        if stats_enabled:
+            count_open(path, perf_counter() - start, valid)
+        if not valid:
+            raise OSError(f'Could not read file {path}')
+        with nogil:
+            properties = ref.audioProperties()
+            info = ctypes.format_info(ref.file())
+        if properties is NULL:
+            raise OSError(f'Could not read audio properties of {path}')
+        return AudioInfo(
+            path=path,
+            format=info.format.decode('utf-8'),
+            codec=info.codec.decode('utf-8', 'replace') or None,
+            length=properties.lengthInMilliseconds() / 1_000.0,
+            bitrate=properties.bitrate(),
+            sampleRate=properties.sampleRate(),
+            channels=properties.channels(),
+            bits_per_sample=info.bits_per_sample or None,
+        )
+    finally:
+        del ref
+
+
+def _probe_one(path, read_style: str = 'average') -> AudioInfo:
+    """Probe a single file for ``probe_many``. Module-level so that process pools can pickle it."""
+    try:
+        return probe(path, read_style)
+    except Exception as e:
+        return AudioInfo(path=as_path(path), error=e)
+
+
+def probe_many(
+        paths: Iterable[Path | str | bytes],
+        workers: Optional[int] = None,
+        executor: str = 'thread',
+        ordered: bool = False,
+        read_style: str = 'average',
+) -> Iterator[AudioInfo]:
+    """Probe the audio properties and format of many files in parallel.
+
+    Works like ``read_many``, but yields ``AudioInfo`` objects as returned by ``probe``. A file
+    that cannot be read does not abort the batch; instead, its result has ``error`` set.
+
+    Args:
+        paths: The files to read.
+        workers: Number of worker threads or processes (default: number of CPUs).
+        executor: Either "thread" or "process".
+        ordered: If True, yield results in the order of ``paths``; otherwise, in completion order.
+        read_style: Read style for audio properties: "fast", "average" or "accurate".
+
+    Yields:
+        An ``AudioInfo`` for each of the given paths.
+    """
+    check_read_style(read_style)
+    if read_style == 'none':
+        raise ValueError('read_style "none" cannot be used to probe audio properties')
+    workers = workers or os.cpu_count() or 1
+    pool = make_executor(executor, workers)
+    try:
+        for path, future in _imap(pool, partial(_probe_one, read_style=read_style), paths,
+                                  4 * workers, ordered):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = AudioInfo(path=as_path(path), error=e)
+            yield result
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling, michaelhelmling@posteo.de
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+from time import perf_counter
+
+cdef bint stats_enabled = False
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """Enable (or disable) the collection of performance counters, see ``stats()``.
+
+    Collecting the counters adds a small overhead to every file operation, so it is disabled by
+    default. Disabling does not reset the counters.
+    """
+    global stats_enabled
+    stats_enabled = enabled
+
+
+def stats() -> dict[str, int | float | dict[str, int]]:
+    """Get the performance counters collected since the last ``reset_stats()``.
+
+    The counters are only updated while enabled with ``enable_stats()``; they are process-wide
+    and include operations on all threads.
+
+    Returns:
+        A dict with the following entries (times are cumulative, in seconds):
+
+        - ``opens``: number of files opened (including failures)
+        - ``open_time``: time spent by TagLib in parsing files when they are opened
+        - ``open_failures``: dict mapping file extensions (formats) to the number of files
+          that could not be opened
+        - ``tag_conversions``, ``tag_conversion_time``: number of and time spent in conversions
+          of TagLib's property map to the ``File.tags`` dict
+        - ``complex_property_bytes``: total size of binary data (e.g. pictures) read from
+          complex properties
+        - ``saves``, ``save_time``: number of and time spent in saving files (including failures)
+        - ``save_failures``: dict mapping file extensions to the number of failed saves
+    """
+    with _stats_lock:
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in _stats.items()}
+
+
+def reset_stats() -> None:
+    """Reset all performance counters to zero."""
+    with _stats_lock:
+        _stats.update(
+            opens=0,
+            open_time=0.0,
+            open_failures={},
+            tag_conversions=0,
+            tag_conversion_time=0.0,
+            complex_property_bytes=0,
+            saves=0,
+            save_time=0.0,
+            save_failures={},
+        )
+
+
+reset_stats()
+
+
+cdef str format_name(source):
+    """Name of the format of ``source`` (a path or file object) for the failure counters, derived
+    from the file name extension."""
+    if is_fileobj(source):
+        source = getattr(source, 'name', None)
+        if not isinstance(source, (str, bytes, os.PathLike)):
+            return 'unknown'
+    return os.path.splitext(os.fsdecode(source))[1][1:].lower() or 'unknown'
+
+
+cdef void count_open(source, double elapsed, bint ok):
+    with _stats_lock:
+        _stats['opens'] += 1
+        _stats['open_time'] += elapsed
+        if not ok:
+            failures = _stats['open_failures']
+            name = format_name(source)
+            failures[name] = failures.get(name, 0) + 1
+
+
+cdef void count_tag_conversion(double elapsed):
+    with _stats_lock:
+        _stats['tag_conversions'] += 1
+        _stats['tag_conversion_time'] += elapsed
+
+
+cdef void count_complex_property_bytes(size_t size):
+    with _stats_lock:
+        _stats['complex_property_bytes'] += size
+
+
+cdef void count_save(source, double elapsed, bint ok):
+    with _stats_lock:
+        _stats['saves'] += 1
+        _stats['save_time'] += elapsed
+        if not ok:
+            failures = _stats['save_failures']
+            name = format_name(source)
+            failures[name] = failures.get(name, 0) + 1
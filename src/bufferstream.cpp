@@ -0,0 +1,55 @@
+#include "bufferstream.hpp"
+
+
+namespace TagLib {
+BufferStream::BufferStream(const char* data, size_t size, const char* name)
+    : data(data), size(static_cast<offset_t>(size)), position(0), file_name(name ? name : "") {}
+
+FileName BufferStream::name() const {
+    return FileName(file_name.c_str());
+}
+
+ByteVector BufferStream::readBlock(size_t length) {
+    if (length == 0 || position >= size) return ByteVector();
+    const offset_t available = size - position;
+    const offset_t count = static_cast<offset_t>(length) < available ? static_cast<offset_t>(length) : available;
+    ByteVector result(data + position, static_cast<unsigned int>(count));
+    position += count;
+    return result;
+}
+
+// the stream is read-only: TagLib checks readOnly() before writing, so the following are no-ops
+
+void BufferStream::writeBlock(const ByteVector&) {}
+
+void BufferStream::insert(const ByteVector&, offset_t, size_t) {}
+
+void BufferStream::removeBlock(offset_t, size_t) {}
+
+void BufferStream::truncate(offset_t) {}
+
+bool BufferStream::readOnly() const {
+    return true;
+}
+
+bool BufferStream::isOpen() const {
+    return true;
+}
+
+void BufferStream::seek(offset_t offset, Position p) {
+    switch (p) {
+        case Beginning: position = offset; break;
+        case Current: position += offset; break;
+        case End: position = size + offset; break;
+    }
+    if (position < 0) position = 0;
+}
+
+offset_t BufferStream::tell() const {
+    return position;
+}
+
+offset_t BufferStream::length() {
+    return size;
+}
+}
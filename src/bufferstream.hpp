@@ -0,0 +1,37 @@
+#pragma once
+#include <string>
+#include <taglib/tiostream.h>
+
+namespace TagLib {
+    //! A read-only TagLib::IOStream over a contiguous block of memory, e.g. a memory-mapped file.
+    /*!
+     * Reading from memory avoids the many small read and seek system calls of TagLib's default
+     * FileStream. The memory is not owned by the stream and must outlive it. The stream does not
+     * call into Python, so it can be used without holding the GIL.
+     */
+    class BufferStream : public IOStream {
+    public:
+        //! Create a stream over size bytes at data; name is used for file type detection.
+        BufferStream(const char* data, size_t size, const char* name);
+        BufferStream(const BufferStream&) = delete;
+        BufferStream& operator=(const BufferStream&) = delete;
+
+        FileName name() const override;
+        ByteVector readBlock(size_t length) override;
+        void writeBlock(const ByteVector& data) override;
+        void insert(const ByteVector& data, offset_t start = 0, size_t replace = 0) override;
+        void removeBlock(offset_t start = 0, size_t length = 0) override;
+        bool readOnly() const override;
+        bool isOpen() const override;
+        void seek(offset_t offset, Position p = Beginning) override;
+        offset_t tell() const override;
+        offset_t length() override;
+        void truncate(offset_t length) override;
+
+    private:
+        const char* data;
+        const offset_t size;
+        offset_t position;
+        std::string file_name;
+    };
+}
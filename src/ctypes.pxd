@@ -6,6 +6,7 @@
 
 """This file contains the external C/C++ definitions used by taglib.pyx."""
 
+from libc.stddef cimport wchar_t
 from libcpp cimport bool as cppbool
 from libcpp.list cimport list
 from libcpp.map cimport map
@@ -22,15 +23,17 @@ cdef extern from 'taglib/tstring.h' namespace 'TagLib':
         String()
         String(char*, Type)
         string to8Bit(bint)
+        const wchar_t* toCWString() const
+        unsigned int size() const
 
 
 cdef extern from 'taglib/tbytevector.h' namespace 'TagLib':
     cdef cppclass ByteVector:
         ByteVector()
         ByteVector(const char* data, unsigned int length)
-        const char* data()
-        unsigned int size()
-        cppbool isEmpty()
+        const char* data() const
+        unsigned int size() const
+        cppbool isEmpty() const
 
 
 cdef extern from 'taglib/tstringlist.h' namespace 'TagLib':
@@ -58,6 +61,7 @@ cdef extern from 'taglib/tlist.h' namespace 'TagLib':
         void append(const T&)
         unsigned int size()
         cppbool isEmpty()
+        cppbool operator==(const List[T]&)
 
 
 cdef extern from 'taglib/tvariant.h' namespace 'TagLib::Variant':
@@ -102,11 +106,13 @@ cdef extern from 'taglib/tpropertymap.h' namespace 'TagLib':
         map[String,StringList].iterator begin()
         map[String,StringList].iterator end()
         StringList& operator[](String&)
+        cppbool contains(const String&)
+        PropertyMap& erase(const String&)
         StringList& unsupportedData()
         int size()
 
 
-cdef extern from 'taglib/audioproperties.h' namespace 'TagLib':
+cdef extern from 'taglib/audioproperties.h' namespace 'TagLib' nogil:
     cdef cppclass AudioProperties:
         int lengthInMilliseconds()
         int bitrate()
@@ -119,7 +125,11 @@ cdef extern from 'taglib/audioproperties.h' namespace 'TagLib::AudioProperties':
         Average = 1
         Accurate = 2
 
-cdef extern from 'taglib/tfile.h' namespace 'TagLib':
+cdef extern from 'taglib/tiostream.h' namespace 'TagLib' nogil:
+    cdef cppclass IOStream:
+        pass
+
+cdef extern from 'taglib/tfile.h' namespace 'TagLib' nogil:
     cdef cppclass File:
         AudioProperties *audioProperties()
         bint save() except +
@@ -129,7 +139,7 @@ cdef extern from 'taglib/tfile.h' namespace 'TagLib':
         PropertyMap setProperties(PropertyMap&)
         void removeUnsupportedProperties(StringList&)
 
-cdef extern from 'taglib/fileref.h' namespace 'TagLib':
+cdef extern from 'taglib/fileref.h' namespace 'TagLib' nogil:
     cdef cppclass FileRef:
         File* file()
 
@@ -142,9 +152,28 @@ cdef extern from 'taglib/fileref.h' namespace 'TagLib':
         List[VariantMap] complexProperties(const String& key)
         cppbool setComplexProperties(const String& key, const List[VariantMap]& value)
 
+        @staticmethod
+        StringList defaultFileExtensions()
+
 cdef extern from 'taglib/taglib.h':
     int TAGLIB_MAJOR_VERSION
     int TAGLIB_MINOR_VERSION
 
 cdef extern from "fileref_factory.hpp" namespace 'TagLib':
-    FileRef* make_fileref(str path_obj)
\ No newline at end of file
+    FileRef* make_fileref(str path_obj, cppbool read_audio_properties, ReadStyle read_style)
+    FileRef* make_fileref_from_stream(IOStream* stream, cppbool read_audio_properties, ReadStyle read_style)
+
+cdef extern from "pyiostream.hpp" namespace 'TagLib':
+    cdef cppclass PyIOStream(IOStream):
+        PyIOStream(object fileobj)
+
+cdef extern from "bufferstream.hpp" namespace 'TagLib':
+    cdef cppclass BufferStream(IOStream):
+        BufferStream(const char* data, size_t size, const char* name)
+cdef extern from "format_info.hpp" namespace 'TagLib' nogil:
+    cdef cppclass FormatInfo:
+        string format
+        string codec
+        int bits_per_sample
+
+    FormatInfo format_info(File* file)
@@ -5,33 +5,61 @@
 #include <Python.h>
 
 
+namespace {
+// Releases the GIL for the lifetime of the object, such that other Python threads can run.
+class GILRelease {
+public:
+    GILRelease() : state(PyEval_SaveThread()) {}
+    ~GILRelease() { PyEval_RestoreThread(state); }
+    GILRelease(const GILRelease&) = delete;
+    GILRelease& operator=(const GILRelease&) = delete;
+private:
+    PyThreadState* state;
+};
+
+// Source is either a TagLib::FileName or a TagLib::IOStream*.
+template <typename Source>
+TagLib::FileRef* new_fileref(Source source, bool read_audio_properties,
+                             TagLib::AudioProperties::ReadStyle read_style) noexcept {
+    GILRelease nogil;
+    try {
+        return new TagLib::FileRef(source, read_audio_properties, read_style);
+    } catch (...) {
+        return nullptr;
+    }
+}
+}
+
 namespace TagLib {
-FileRef* make_fileref(PyObject* path_obj) noexcept {
+FileRef* make_fileref(PyObject* path_obj, bool read_audio_properties,
+                      AudioProperties::ReadStyle read_style) noexcept {
     if (!path_obj) return nullptr;
-    try {
 #ifdef _WIN32        // Windows: convert Python str to wchar_t*
-        wchar_t* wchar_path = PyUnicode_AsWideCharString(path_obj, nullptr);
-        if (!wchar_path) {
-            PyErr_Clear();
-            return nullptr;
-        }
-        FileRef* file_ref = new FileRef(FileName(wchar_path), true, TagLib::AudioProperties::ReadStyle::Average);
-        PyMem_Free(wchar_path);
-        return file_ref;
+    wchar_t* wchar_path = PyUnicode_AsWideCharString(path_obj, nullptr);
+    if (!wchar_path) {
+        PyErr_Clear();
+        return nullptr;
+    }
+    FileRef* file_ref = new_fileref(FileName(wchar_path), read_audio_properties, read_style);
+    PyMem_Free(wchar_path);
+    return file_ref;
 #else
-        // Unix: encode Python str to UTF-8 bytes
-        PyObject* utf8_bytes = PyUnicode_AsUTF8String(path_obj);
-        if (!utf8_bytes) {
-            PyErr_Clear();
-            return nullptr;
-        }
-        const char* utf8_path = PyBytes_AsString(utf8_bytes);
-        FileRef* file_ref = new FileRef(utf8_path, true, TagLib::AudioProperties::ReadStyle::Average);
-        Py_DECREF(utf8_bytes);
-        return file_ref;
-#endif
-    } catch (...) {
+    // Unix: encode Python str to UTF-8 bytes
+    PyObject* utf8_bytes = PyUnicode_AsUTF8String(path_obj);
+    if (!utf8_bytes) {
+        PyErr_Clear();
         return nullptr;
     }
+    const char* utf8_path = PyBytes_AsString(utf8_bytes);
+    FileRef* file_ref = new_fileref(utf8_path, read_audio_properties, read_style);
+    Py_DECREF(utf8_bytes);
+    return file_ref;
+#endif
+}
+
+FileRef* make_fileref_from_stream(IOStream* stream, bool read_audio_properties,
+                                  AudioProperties::ReadStyle read_style) noexcept {
+    if (!stream) return nullptr;
+    return new_fileref(stream, read_audio_properties, read_style);
 }
 }
\ No newline at end of file
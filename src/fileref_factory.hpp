@@ -1,15 +1,31 @@
 #pragma once
 #include <Python.h>
+#include <taglib/audioproperties.h>
 
 namespace TagLib {
     class FileRef;
+    class IOStream;
     //! Create a TagLib::FileRef from a Python path object (str).
     /*!
      * This method provides a platform-independent interface to the Cython taglib extension.
+     * It must be called with the GIL held; the GIL is released while TagLib opens and parses the file.
      *
      * \param path_obj A Python str object representing the file path.
+     * \param read_audio_properties Whether to read audio properties (length, bitrate, ...) at all.
+     * \param read_style Accuracy of the audio properties, if they are read.
      * \return A pointer to a TagLib::FileRef, or nullptr on failure.
      *
     */
-    FileRef* make_fileref(PyObject* path_obj) noexcept;
+    FileRef* make_fileref(PyObject* path_obj, bool read_audio_properties,
+                          AudioProperties::ReadStyle read_style) noexcept;
+
+    //! Create a TagLib::FileRef reading from the given stream.
+    /*!
+     * The file type is detected from the stream's contents. The stream is not owned by the
+     * FileRef and must outlive it. Like make_fileref(), this must be called with the GIL held.
+     *
+     * \return A pointer to a TagLib::FileRef, or nullptr on failure.
+    */
+    FileRef* make_fileref_from_stream(IOStream* stream, bool read_audio_properties,
+                                      AudioProperties::ReadStyle read_style) noexcept;
 }
\ No newline at end of file
@@ -0,0 +1,134 @@
+#include "format_info.hpp"
+#include <taglib/tfile.h>
+#include <taglib/aifffile.h>
+#include <taglib/apefile.h>
+#include <taglib/asffile.h>
+#include <taglib/flacfile.h>
+#include <taglib/itfile.h>
+#include <taglib/modfile.h>
+#include <taglib/mp4file.h>
+#include <taglib/mpcfile.h>
+#include <taglib/mpegfile.h>
+#include <taglib/oggflacfile.h>
+#include <taglib/opusfile.h>
+#include <taglib/s3mfile.h>
+#include <taglib/speexfile.h>
+#include <taglib/trueaudiofile.h>
+#include <taglib/vorbisfile.h>
+#include <taglib/wavfile.h>
+#include <taglib/wavpackfile.h>
+#include <taglib/xmfile.h>
+
+
+namespace {
+std::string mpeg_codec(const TagLib::MPEG::Properties* properties) {
+    std::string version;
+    switch (properties->version()) {
+        case TagLib::MPEG::Header::Version1: version = "MPEG-1"; break;
+        case TagLib::MPEG::Header::Version2: version = "MPEG-2"; break;
+        case TagLib::MPEG::Header::Version2_5: version = "MPEG-2.5"; break;
+        default: return "MPEG";
+    }
+    return version + " Layer " + std::to_string(properties->layer());
+}
+
+std::string mp4_codec(const TagLib::MP4::Properties* properties) {
+    switch (properties->codec()) {
+        case TagLib::MP4::Properties::AAC: return "AAC";
+        case TagLib::MP4::Properties::ALAC: return "ALAC";
+        default: return "";
+    }
+}
+
+std::string wav_codec(const TagLib::RIFF::WAV::Properties* properties) {
+    switch (properties->format()) {
+        case 1: return "PCM";
+        case 3: return "IEEE float";
+        case 6: return "A-law";
+        case 7: return "mu-law";
+        default: return "";
+    }
+}
+}
+
+
+namespace TagLib {
+    FormatInfo format_info(File* file) noexcept {
+        FormatInfo info;
+        try {
+            if (auto f = dynamic_cast<MPEG::File*>(file)) {
+                info.format = "MPEG";
+                if (auto p = f->audioProperties()) info.codec = mpeg_codec(p);
+            } else if (auto f = dynamic_cast<FLAC::File*>(file)) {
+                info.format = "FLAC";
+                info.codec = "FLAC";
+                if (auto p = f->audioProperties()) info.bits_per_sample = p->bitsPerSample();
+            } else if (dynamic_cast<Ogg::Vorbis::File*>(file)) {
+                info.format = "OggVorbis";
+                info.codec = "Vorbis";
+            } else if (dynamic_cast<Ogg::Opus::File*>(file)) {
+                info.format = "OggOpus";
+                info.codec = "Opus";
+            } else if (auto f = dynamic_cast<Ogg::FLAC::File*>(file)) {
+                info.format = "OggFLAC";
+                info.codec = "FLAC";
+                if (auto p = f->audioProperties()) info.bits_per_sample = p->bitsPerSample();
+            } else if (dynamic_cast<Ogg::Speex::File*>(file)) {
+                info.format = "OggSpeex";
+                info.codec = "Speex";
+            } else if (auto f = dynamic_cast<MP4::File*>(file)) {
+                info.format = "MP4";
+                if (auto p = f->audioProperties()) {
+                    info.codec = mp4_codec(p);
+                    info.bits_per_sample = p->bitsPerSample();
+                }
+            } else if (auto f = dynamic_cast<RIFF::WAV::File*>(file)) {
+                info.format = "WAV";
+                if (auto p = f->audioProperties()) {
+                    info.codec = wav_codec(p);
+                    info.bits_per_sample = p->bitsPerSample();
+                }
+            } else if (auto f = dynamic_cast<RIFF::AIFF::File*>(file)) {
+                info.format = "AIFF";
+                if (auto p = f->audioProperties()) {
+                    info.codec = p->isAiffC() ? p->compressionName().to8Bit(true) : "PCM";
+                    info.bits_per_sample = p->bitsPerSample();
+                }
+            } else if (auto f = dynamic_cast<APE::File*>(file)) {
+                info.format = "APE";
+                info.codec = "Monkey's Audio";
+                if (auto p = f->audioProperties()) info.bits_per_sample = p->bitsPerSample();
+            } else if (auto f = dynamic_cast<WavPack::File*>(file)) {
+                info.format = "WavPack";
+                info.codec = "WavPack";
+                if (auto p = f->audioProperties()) info.bits_per_sample = p->bitsPerSample();
+            } else if (auto f = dynamic_cast<ASF::File*>(file)) {
+                info.format = "ASF";
+                if (auto p = f->audioProperties()) {
+                    info.codec = p->codecName().to8Bit(true);
+                    info.bits_per_sample = p->bitsPerSample();
+                }
+            } else if (dynamic_cast<MPC::File*>(file)) {
+                info.format = "MPC";
+                info.codec = "Musepack";
+            } else if (auto f = dynamic_cast<TrueAudio::File*>(file)) {
+                info.format = "TrueAudio";
+                info.codec = "TTA";
+                if (auto p = f->audioProperties()) info.bits_per_sample = p->bitsPerSample();
+            } else if (dynamic_cast<IT::File*>(file)) {
+                info.format = "IT";
+            } else if (dynamic_cast<S3M::File*>(file)) {
+                info.format = "S3M";
+            } else if (dynamic_cast<XM::File*>(file)) {
+                info.format = "XM";
+            } else if (dynamic_cast<Mod::File*>(file)) {
+                info.format = "MOD";
+            } else {
+                info.format = "unknown";
+            }
+        } catch (...) {
+            info.format = "unknown";
+        }
+        return info;
+    }
+}
@@ -0,0 +1,23 @@
+#pragma once
+#include <string>
+
+namespace TagLib {
+    class File;
+
+    //! Format details of an opened file that are not part of TagLib's generic AudioProperties.
+    struct FormatInfo {
+        //! Name of the file format (e.g. "MPEG", "FLAC", "OggVorbis"), or "unknown".
+        std::string format;
+        //! Name of the audio codec (e.g. "MPEG-1 Layer 3", "AAC", "PCM"), empty if unknown.
+        std::string codec;
+        //! Bits per sample, or 0 if not available for the format.
+        int bits_per_sample = 0;
+    };
+
+    //! Determine the format of file, which must be valid, by checking its concrete type.
+    /*!
+     * The codec and bits per sample are taken from the format-specific audio properties, if they
+     * were read. Does not call into Python, so the GIL need not be held.
+     */
+    FormatInfo format_info(File* file) noexcept;
+}
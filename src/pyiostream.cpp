@@ -0,0 +1,164 @@
+#include "pyiostream.hpp"
+
+
+namespace {
+// Holds the GIL for the lifetime of the object; may be nested, and used with or without the GIL.
+class GILState {
+public:
+    GILState() : state(PyGILState_Ensure()) {}
+    ~GILState() { PyGILState_Release(state); }
+    GILState(const GILState&) = delete;
+    GILState& operator=(const GILState&) = delete;
+private:
+    PyGILState_STATE state;
+};
+
+// Discard the result of a Python method call. Returns false (and clears the error) on failure.
+bool check_call(PyObject* result) {
+    if (!result) {
+        PyErr_Clear();
+        return false;
+    }
+    Py_DECREF(result);
+    return true;
+}
+}
+
+namespace TagLib {
+PyIOStream::PyIOStream(PyObject* fileobj) : fileobj(fileobj), read_only(true) {
+    Py_INCREF(fileobj);
+    PyObject* name = PyObject_GetAttrString(fileobj, "name");
+    if (name && PyUnicode_Check(name)) {
+        const char* utf8_name = PyUnicode_AsUTF8(name);
+        if (utf8_name) file_name = utf8_name;
+    }
+    Py_XDECREF(name);
+    PyObject* writable = PyObject_CallMethod(fileobj, "writable", nullptr);
+    if (writable) {
+        read_only = PyObject_IsTrue(writable) != 1;
+        Py_DECREF(writable);
+    }
+    PyErr_Clear();
+}
+
+PyIOStream::~PyIOStream() {
+    GILState gil;
+    Py_DECREF(fileobj);
+}
+
+FileName PyIOStream::name() const {
+    return FileName(file_name.c_str());
+}
+
+ByteVector PyIOStream::readBlock(size_t length) {
+    GILState gil;
+    PyObject* data = PyObject_CallMethod(fileobj, "read", "n", static_cast<Py_ssize_t>(length));
+    if (!data) {
+        PyErr_Clear();
+        return ByteVector();
+    }
+    Py_buffer view;
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) != 0) {
+        PyErr_Clear();
+        Py_DECREF(data);
+        return ByteVector();
+    }
+    ByteVector result(static_cast<const char*>(view.buf), static_cast<unsigned int>(view.len));
+    PyBuffer_Release(&view);
+    Py_DECREF(data);
+    return result;
+}
+
+void PyIOStream::writeBlock(const ByteVector& data) {
+    if (read_only) return;
+    GILState gil;
+    PyObject* view = PyMemoryView_FromMemory(const_cast<char*>(data.data()), data.size(), PyBUF_READ);
+    if (!view) {
+        PyErr_Clear();
+        return;
+    }
+    check_call(PyObject_CallMethod(fileobj, "write", "O", view));
+    Py_DECREF(view);
+}
+
+void PyIOStream::insert(const ByteVector& data, offset_t start, size_t replace) {
+    if (read_only) return;
+    if (data.size() == replace) {
+        seek(start);
+        writeBlock(data);
+        return;
+    }
+    // Python file objects have no insert operation, so read everything behind the replaced
+    // block and write it back after the new data
+    const offset_t tail_start = start + static_cast<offset_t>(replace);
+    const offset_t old_length = length();
+    seek(tail_start);
+    const ByteVector tail = readBlock(static_cast<size_t>(old_length > tail_start ? old_length - tail_start : 0));
+    seek(start);
+    writeBlock(data);
+    writeBlock(tail);
+    if (data.size() < replace) truncate(tell());
+}
+
+void PyIOStream::removeBlock(offset_t start, size_t length) {
+    if (read_only) return;
+    const offset_t tail_start = start + static_cast<offset_t>(length);
+    const offset_t old_length = this->length();
+    seek(tail_start);
+    const ByteVector tail = readBlock(static_cast<size_t>(old_length > tail_start ? old_length - tail_start : 0));
+    seek(start);
+    writeBlock(tail);
+    truncate(tell());
+}
+
+bool PyIOStream::readOnly() const {
+    return read_only;
+}
+
+bool PyIOStream::isOpen() const {
+    GILState gil;
+    PyObject* closed = PyObject_GetAttrString(fileobj, "closed");
+    if (!closed) {
+        // file-like objects without a "closed" attribute are assumed to be always open
+        PyErr_Clear();
+        return true;
+    }
+    const bool is_open = PyObject_IsTrue(closed) == 0;
+    Py_DECREF(closed);
+    return is_open;
+}
+
+void PyIOStream::seek(offset_t offset, Position p) {
+    GILState gil;
+    // IOStream::Position values (Beginning, Current, End) coincide with Python's whence
+    check_call(PyObject_CallMethod(fileobj, "seek", "Li", static_cast<long long>(offset),
+                                             static_cast<int>(p)));
+}
+
+offset_t PyIOStream::tell() const {
+    GILState gil;
+    PyObject* position = PyObject_CallMethod(fileobj, "tell", nullptr);
+    if (!position) {
+        PyErr_Clear();
+        return -1;
+    }
+    const long long result = PyLong_AsLongLong(position);
+    Py_DECREF(position);
+    if (result == -1 && PyErr_Occurred()) PyErr_Clear();
+    return static_cast<offset_t>(result);
+}
+
+offset_t PyIOStream::length() {
+    const offset_t position = tell();
+    seek(0, End);
+    const offset_t result = tell();
+    seek(position);
+    return result;
+}
+
+void PyIOStream::truncate(offset_t length) {
+    if (read_only) return;
+    GILState gil;
+    check_call(PyObject_CallMethod(fileobj, "truncate", "L", static_cast<long long>(length)));
+}
+}
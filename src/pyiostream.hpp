@@ -0,0 +1,40 @@
+#pragma once
+#include <Python.h>
+#include <string>
+#include <taglib/tiostream.h>
+
+namespace TagLib {
+    //! A TagLib::IOStream that reads from and writes to a Python binary file object.
+    /*!
+     * The file object must provide read(), seek() and tell() and, for saving, write() and
+     * truncate(); io.BytesIO and files opened with open(..., 'rb') or 'r+b' qualify.
+     * All methods acquire the GIL while calling into Python, so the stream can be used from
+     * code that has released it. Exceptions raised by the file object are cleared and treated
+     * like an I/O error (e.g. an empty read).
+     */
+    class PyIOStream : public IOStream {
+    public:
+        //! Wrap the given file object; must be called with the GIL held.
+        explicit PyIOStream(PyObject* fileobj);
+        ~PyIOStream() override;
+        PyIOStream(const PyIOStream&) = delete;
+        PyIOStream& operator=(const PyIOStream&) = delete;
+
+        FileName name() const override;
+        ByteVector readBlock(size_t length) override;
+        void writeBlock(const ByteVector& data) override;
+        void insert(const ByteVector& data, offset_t start = 0, size_t replace = 0) override;
+        void removeBlock(offset_t start = 0, size_t length = 0) override;
+        bool readOnly() const override;
+        bool isOpen() const override;
+        void seek(offset_t offset, Position p = Beginning) override;
+        offset_t tell() const override;
+        offset_t length() override;
+        void truncate(offset_t length) override;
+
+    private:
+        PyObject* fileobj;
+        std::string file_name;
+        bool read_only;
+    };
+}
@@ -11,31 +11,139 @@
 The main purpose is to show how pytaglib is used, but it also serves as a tool
 showing *all* metadata of a given while, while most taggers only display a set
 of certain tags they know.
+
+Besides the human-readable default output, the script can dump metadata as JSON,
+newline-delimited JSON or tab-separated values, reading files in parallel.
 """
 import argparse
+import json
+import os
 import sys
+from itertools import tee
 
 import taglib
 
+PROPERTIES = ("length", "bitrate", "sampleRate", "channels")
+
+
+def expand_paths(names):
+    """Yield the given file names, replacing directories by the audio files they contain (recursively).
+
+    Directories are walked the same way as by ``taglib.scan``, so both find the same files.
+    """
+    extensions = taglib.supported_extensions()
+    for name in names:
+        if os.path.isdir(name):
+            yield from taglib._iter_files(name, extensions, True)
+        else:
+            yield name
+
+
+def picture_record(info):
+    return {
+        "picture_type": info.picture_type,
+        "mime_type": info.mime_type,
+        "description": info.description,
+        "width": info.width,
+        "height": info.height,
+        "size": info.size,
+    }
+
+
+def record(name, result, properties):
+    """Convert a ``ReadResult`` into a JSON-serializable dict."""
+    if not result.ok:
+        return {"path": name, "error": str(result.error)}
+    rec = {"path": name, "tags": result.tags}
+    if properties:
+        for prop in PROPERTIES:
+            rec[prop] = getattr(result, prop)
+        rec["pictures"] = [picture_record(info) for info in result.pictures]
+    return rec
+
+
+def print_text(name, result, properties, first):
+    if not first:
+        print()
+    print(f"{name}:")
+    tags = result.tags
+    if len(tags) > 0:
+        max_key_len = max(len(key) for key in tags.keys())
+        for key, values in tags.items():
+            for value in values:
+                print(f"  {key.ljust(max_key_len)} = {value}")
+    if properties:
+        print(f"  [length: {result.length} s, bitrate: {result.bitrate} kb/s, "
+              f"sample rate: {result.sampleRate} Hz, channels: {result.channels}]")
+        for info in result.pictures:
+            print(f"  [picture: {info.picture_type}, {info.mime_type}, {info.size} bytes]")
+
+
+def tsv_escape(value):
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def print_tsv(name, result, properties):
+    """Print one ``path<TAB>key<TAB>value`` line per tag value (and property, if requested)."""
+    rows = [(key, value) for key, values in result.tags.items() for value in values]
+    if properties:
+        rows.extend((prop, getattr(result, prop)) for prop in PROPERTIES)
+        rows.extend(("picture", f"{info.picture_type};{info.mime_type};{info.size}")
+                    for info in result.pictures)
+    for key, value in rows:
+        print(f"{tsv_escape(name)}\t{tsv_escape(key)}\t{tsv_escape(value)}")
+
 
 def script():
     """Print tags of given files"""
     parser = argparse.ArgumentParser(
         description="Print all textual tags of one or more audio files."
     )
-    parser.add_argument("file", nargs="+", help="file(s) to print tags of")
+    parser.add_argument("file", nargs="+", help="file(s) to print tags of; directories are searched recursively")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of files to read in parallel")
+    parser.add_argument("-f", "--format", choices=["text", "json", "ndjson", "tsv"], default="text",
+                        help="output format (default: text)")
+    parser.add_argument("-k", "--keys", help="comma-separated list of tags to print (default: all)")
+    parser.add_argument("-p", "--properties", action="store_true",
+                        help="also print audio properties and embedded pictures")
     args = parser.parse_args()
-    for i, filename in enumerate(args.file):
-        print(f"{filename}:")
-        file = taglib.File(filename)
-        tags = file.tags
-        if len(tags) > 0:
-            max_key_len = max(len(key) for key in tags.keys())
-            for key, values in tags.items():
-                for value in values:
-                    print(f"  {key.ljust(max_key_len)} = {value}")
-        if i < len(args.file) - 1:
-            print()
+    if args.jobs < 1:
+        parser.error("--jobs must be positive")
+    keys = args.keys.split(",") if args.keys else None
+
+    # text output is printed in input order; machine-readable output as soon as files are read
+    read_options = dict(workers=args.jobs, keys=keys, read_style="average" if args.properties else "none",
+                        pictures=args.properties)
+    if args.format == "text":
+        names, paths = tee(expand_paths(args.file))
+        results = zip(names, taglib.read_many(paths, ordered=True, **read_options))
+    else:
+        results = ((str(result.path), result) for result in taglib.read_many(expand_paths(args.file), **read_options))
+    errors = printed = 0
+    if args.format == "json":
+        print("[")
+    elif args.format == "tsv":
+        print("path\tkey\tvalue")
+    for name, result in results:
+        if not result.ok:
+            errors += 1
+            if args.format in ("text", "tsv"):
+                print(f"{name}: {result.error}", file=sys.stderr)
+                continue
+        if args.format == "text":
+            print_text(name, result, args.properties, first=printed == 0)
+        elif args.format == "tsv":
+            print_tsv(name, result, args.properties)
+        else:
+            line = json.dumps(record(name, result, args.properties), ensure_ascii=False)
+            if args.format == "json":
+                line = f"  {line}" if printed == 0 else f", {line}"
+            print(line, flush=True)
+        printed += 1
+    if args.format == "json":
+        print("]")
+    if errors:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
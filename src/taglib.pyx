@@ -1,31 +1,54 @@
 # -*- coding: utf-8 -*-
 # distutils: language = c++
+# cython: freethreading_compatible = True
 # Copyright 2021 Michael Helmling, michaelhelmling@posteo.de
 #
 # This program is free software; you can redistribute it and/or modify
 # it under the terms of the GNU General Public License version 3 as
 # published by the Free Software Foundation
-from collections.abc import Mapping, Sequence, Iterable
-from dataclasses import dataclass
-from typing import Optional, Union
+import json
+import mmap
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Mapping, Sequence, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from functools import partial
+from io import BytesIO
+from types import ModuleType
+from typing import BinaryIO, Optional, Union
 
 from pathlib import Path
 cimport ctypes
 
 include "_cdef_helpers.pxi"
+include "_stats.pxi"
 
 version = '3.2.0'
 
-Variant = Union[None, bool, int, bytes, "VariantMap"]
+Variant = Union[None, bool, int, bytes, memoryview, "VariantMap"]
 VariantMap = Mapping[str, Variant]
 
+# TagLib's read styles for audio properties; "none" skips reading audio properties entirely
+_read_styles = {
+    'none': ctypes.Average,
+    'fast': ctypes.Fast,
+    'average': ctypes.Average,
+    'accurate': ctypes.Accurate,
+}
+
 
 @dataclass(slots=True)
 class Picture:
     """Represents an embedded picture (cover art) in an audio file.
 
     Attributes:
-        data: The raw image data (e.g., JPEG or PNG bytes).
+        data: The raw image data (e.g., JPEG or PNG bytes). Pictures returned by
+            ``File.get_pictures(copy=False)`` hold a read-only memoryview instead.
         mime_type: MIME type of the image (e.g., "image/jpeg", "image/png").
         description: Optional description of the picture (default: "").
         picture_type: Type of picture (default: "Front Cover"). Common values:
@@ -44,7 +67,7 @@ class Picture:
                     picture_type='Front Cover'
                 )
     """
-    data: bytes
+    data: bytes | memoryview
     mime_type: str
     description: str = ""
     picture_type: str = "Front Cover"
@@ -78,11 +101,99 @@ class Picture:
         )
 
 
+@dataclass(slots=True)
+class PictureInfo:
+    """Describes an embedded picture without copying its image data.
+
+    Returned by ``File.picture_info``; the image data is only copied into a bytes object when
+    ``data`` or ``to_picture()`` is accessed. Picture summaries returned by ``CachedReader`` do not
+    hold the image data at all.
+
+    Attributes:
+        mime_type: MIME type of the image (e.g., "image/jpeg", "image/png").
+        description: Description of the picture.
+        picture_type: Type of picture (e.g. "Front Cover").
+        width: Image width in pixels (may be None, mainly available for FLAC).
+        height: Image height in pixels (may be None, mainly available for FLAC).
+        size: Size of the image data in bytes.
+    """
+    mime_type: str
+    description: str
+    picture_type: str
+    width: Optional[int]
+    height: Optional[int]
+    size: int
+    _view: Optional[memoryview] = field(default=None, repr=False, compare=False)
+
+    @property
+    def data(self) -> bytes:
+        """The raw image data.
+
+        Raises:
+            ValueError: If this object does not hold the image data.
+        """
+        if self._view is None:
+            raise ValueError('image data not available; open the file to load the picture')
+        return bytes(self._view)
+
+    def to_picture(self) -> Picture:
+        """Load the image data and return a full ``Picture``."""
+        return Picture(
+            data=self.data,
+            mime_type=self.mime_type,
+            description=self.description,
+            picture_type=self.picture_type,
+            width=self.width,
+            height=self.height,
+        )
+
+    @classmethod
+    def _from_variant_map(cls, d: VariantMap) -> 'PictureInfo':
+        """Create PictureInfo from dictionary returned by TagLib with ``copy=False``."""
+        view = d.get('data', memoryview(b''))
+        return cls(
+            mime_type=d.get('mimeType', ''),
+            description=d.get('description', ''),
+            picture_type=d.get('pictureType', 'Front Cover'),
+            width=d.get('width'),
+            height=d.get('height'),
+            size=len(view),
+            _view=view,
+        )
+
+
+class SaveResult(dict):
+    """Result of ``File.save``: a dict of the tags that could not be saved.
+
+    Attributes:
+        written: Whether the file was actually written. This is False if nothing was changed
+            since the file was opened or last saved.
+        in_place: Whether the file kept its size, i.e. the new tags fit into the space of the old
+            ones (including padding) and only the tags were overwritten. False if the size of the
+            file changed: for tags at the start of the file (ID3v2, FLAC, MP4, Ogg, ...), the
+            audio data following them was rewritten, but tags at the end (APE tags and ID3v1, as
+            used by WavPack, APE and MPC files) grow or shrink without moving the audio data.
+            None if the file was not written.
+    """
+    __slots__ = ('written', 'in_place')
+
+    def __init__(self, remaining: Mapping[str, list[str]] = (), written: bool = True,
+                 in_place: Optional[bool] = None):
+        super().__init__(remaining)
+        self.written = written
+        self.in_place = in_place
+
+    def __repr__(self) -> str:
+        return f'SaveResult({dict.__repr__(self)}, written={self.written}, in_place={self.in_place})'
+
+
 cdef class File:
     """Class representing an audio file with metadata ("tags").
 
     To read tags from an audio file, create a File object, passing the file's path to the
-    constructor (should be a unicode string).
+    constructor (should be a unicode string). Alternatively, pass a seekable binary file object
+    such as ``io.BytesIO``, or use ``File.from_bytes`` for audio data in memory; ``save`` then
+    writes back into that file object.
 
     The tags are stored in the attribute ``tags`` as a dict mapping strings (tag names)
     to lists of strings (tag values).
@@ -93,14 +204,38 @@ cdef class File:
     method ``removeUnsupportedProperties``, some or all of those can be removed.
 
     Additionally, the readonly attributes ``length``, ``bitrate``, ``sampleRate``, and
-    ``channels`` are available with their obvious meanings.
+    ``channels`` are available with their obvious meanings. How accurately they are computed
+    is controlled by the ``read_style`` constructor argument, one of "fast", "average" (the default)
+    and "accurate". Use ``read_style="none"`` to skip reading audio properties altogether if you
+    only need the tags; accessing them then raises a ``ValueError``.
+
+    When scanning many files without modifying them, pass ``io="mmap"`` to read the file through
+    a read-only memory map instead of many small read and seek calls. Such files cannot be saved,
+    and file objects cannot be opened this way.
+
+    Changes to the ``tags`` attribute are stored using the ``save`` method. The file is only
+    written if ``tags`` or the pictures (complex properties) actually differ from what was read
+    from the file; see ``is_modified``.
+
+    Both ``tags`` and ``unsupported`` are converted from TagLib's native representation on first
+    access, so no Python strings are created for files whose tags are never looked at. To convert
+    only some tags, pass their names as ``keys``; ``tags`` then contains just those keys, and
+    ``save`` leaves all other tags in the file unchanged.
 
-    Changes to the ``tags`` attribute are stored using the ``save`` method.
+    To keep a long-lived File consistent with a file that other programs may modify, call
+    ``refresh_if_changed``; it re-reads the file only if its size, mtime or inode changed.
+
+    A File may be used from several threads, also on free-threaded Python builds: calls into
+    TagLib are serialized by a lock held by each File. The ``tags`` dict itself is not locked.
 
     Attributes:
         tags: Dict mapping tag names to lists of tag values.
-        path: Path to the audio file.
+        path: Path to the audio file (None if the file was opened from a file object).
+        fileobj: The file object the file was opened from, or None.
         unsupported: List of unsupported property identifiers.
+        read_style: The read style used for audio properties.
+        io: How the file is accessed: "stream" (TagLib's file stream, the default) or "mmap".
+        keys: Sorted tuple of the (upper-case) tag names to read, or None to read all tags.
 
     Example:
         ::
@@ -110,88 +245,308 @@ cdef class File:
                 print(f'{tag}->{", ".join(values)}')
             print(f'File length: {f.length}')
             f.save()
+
+        Tag audio data in memory::
+
+            f = taglib.File.from_bytes(data)
+            f.tags['TITLE'] = ['new title']
+            f.save()
+            data = f.fileobj.getvalue()
     """
     cdef ctypes.FileRef *cFile
-    cdef public dict[str | bytes, str | bytes] tags
+    cdef ctypes.IOStream *cStream
+    cdef ctypes.PropertyMap cTags
+    cdef dict _tags
+    cdef list _unsupported
+    cdef bint complex_modified
     cdef readonly object path
-    cdef readonly list unsupported
+    cdef readonly object fileobj
+    cdef readonly str io
+    cdef object mapping
+    cdef Py_buffer mapped
     cdef readonly object save_on_exit
+    cdef readonly str read_style
+    cdef readonly tuple keys
+    cdef tuple file_stat
+    cdef object lock
+
+    def __cinit__(self, path, save_on_exit: bool = False, read_style: str = 'average',
+                  keys: Optional[Iterable[str]] = None, io: str = 'stream'):
+        check_read_style(read_style)
+        check_io(io)
+        self.read_style = read_style
+        self.keys = normalize_keys(keys)
+        self.io = io
+        self.lock = threading.RLock()
+        if is_fileobj(path):
+            if io != 'stream':
+                raise ValueError(f'io={io!r} requires a path, not a file object')
+            self.fileobj = path
+        else:
+            self.path = as_path(path)
+        self.open_file()
+
+    cdef void open_file(self) except *:
+        """Create the TagLib::FileRef (and the stream it reads from) for ``path`` or ``fileobj``.
+
+        For files opened by path, the file's size, mtime and inode are recorded before it is parsed,
+        so ``refresh_if_changed`` also notices changes made while parsing.
+        """
+        cdef double start = perf_counter() if stats_enabled else 0
+        cdef str read_style = self.read_style
+        if self.fileobj is not None:
+            source = self.fileobj
+            self.cStream = new ctypes.PyIOStream(source)
+            self.cFile = ctypes.make_fileref_from_stream(
+                self.cStream, read_style != 'none', _read_styles[read_style])
+        else:
+            source = self.path
+            self.file_stat = stat_signature(source)
+            if self.io == 'mmap':
+                self.mapping = map_file(source)
+                PyObject_GetBuffer(self.mapping, &self.mapped, PyBUF_SIMPLE)
+                self.cStream = new ctypes.BufferStream(
+                    <const char*>self.mapped.buf, self.mapped.len, os.fsencode(source))
+                self.cFile = ctypes.make_fileref_from_stream(
+                    self.cStream, read_style != 'none', _read_styles[read_style])
+            else:
+                self.cFile = ctypes.make_fileref(str(source), read_style != 'none', _read_styles[read_style])
+        cdef bint valid = self.cFile is not NULL and self.cFile.file() is not NULL and self.cFile.file().isValid()
+        if stats_enabled:
+            count_open(source, perf_counter() - start, valid)
+        if not valid:
+            self.release()
+            raise OSError(f'Could not read file {source}')
+
+    @classmethod
+    def from_bytes(cls, data: bytes, **kwargs) -> File:
+        """Open audio data held in memory.
 
-    def __cinit__(self, path, save_on_exit: bool = False):
-        if not isinstance(path, Path):
-            if isinstance(path, bytes):
-                path = path.decode('utf-8')
-            path = Path(path)
-        self.path = path
-        self.cFile = ctypes.make_fileref(str(path))
-        if self.cFile is NULL or self.cFile.file() is NULL or not self.cFile.file().isValid():
-            raise OSError(f'Could not read file {path}')
-
-    def __init__(self, path: Path | str | bytes, save_on_exit: bool = False) -> None:
-        self.tags = dict()
-        self.unsupported = list()
+        The data is copied into an ``io.BytesIO``, available as the ``fileobj`` attribute, which
+        receives the changes when the file is saved.
+
+        Args:
+            data: Contents of an audio file.
+            kwargs: Further arguments passed to the ``File`` constructor.
+        """
+        return cls(BytesIO(data), **kwargs)
+
+    def __init__(self, path: Path | str | bytes | BinaryIO, save_on_exit: bool = False,
+                 read_style: str = 'average', keys: Optional[Iterable[str]] = None,
+                 io: str = 'stream') -> None:
         self.readProperties()
         self.save_on_exit = save_on_exit
 
     cdef void readProperties(self):
-        """Convert the Taglib::PropertyMap of the wrapped Taglib::File object into a python dict.
+        """Read the Taglib::PropertyMap of the wrapped Taglib::File object.
 
-        This method is not accessible from Python, and is called only once, immediately after
-        object creation.
+        The map is converted into the python dict ``tags`` (and the ``unsupported`` list) only when
+        these are first accessed. This method is not accessible from Python, and is called after
+        object creation and by ``reload``.
         """
+        cdef ctypes.PropertyMap cTags
+        with self.lock:
+            self.check_closed()
+            with nogil:
+                cTags = self.cFile.properties()
+            self.cTags = cTags
+            self._tags = None
+            self._unsupported = None
+            self.complex_modified = False
 
+    @property
+    def tags(self) -> dict[str | bytes, list[str | bytes]]:
+        """Dict mapping tag names to lists of tag values."""
+        with self.lock:
+            if self._tags is None:
+                if stats_enabled:
+                    start = perf_counter()
+                    self._tags = propertyMapToDict(self.cTags, self.keys)
+                    count_tag_conversion(perf_counter() - start)
+                else:
+                    self._tags = propertyMapToDict(self.cTags, self.keys)
+            return self._tags
+
+    @tags.setter
+    def tags(self, value: dict[str | bytes, list[str | bytes]]) -> None:
+        with self.lock:
+            self._tags = value
+
+    @property
+    def unsupported(self) -> list[str]:
+        """List of unsupported property identifiers."""
         cdef:
-            ctypes.PropertyMap cTags = self.cFile.properties()
             ctypes.String cString
             ctypes.StringList unsupported
-        self.tags = propertyMapToDict(cTags)
-        unsupported = cTags.unsupportedData()
-        for cString in unsupported:
-            self.unsupported.append(toStr(cString))
+        with self.lock:
+            if self._unsupported is None:
+                self._unsupported = []
+                unsupported = self.cTags.unsupportedData()
+                for cString in unsupported:
+                    self._unsupported.append(toStr(cString))
+            return self._unsupported
 
-    def save(self) -> dict[str, str]:
+    @property
+    def is_modified(self) -> bool:
+        """True if ``tags``, pictures, or other complex properties were changed since the file was
+        opened or last saved."""
+        with self.lock:
+            return self.complex_modified or self.tags_modified()
+
+    cdef bint tags_modified(self) except -1:
+        if self._tags is None:
+            return False
+        return normalize_tags(self._tags) != propertyMapToDict(self.cTags, self.keys)
+
+    def save(self, force: bool = False) -> SaveResult:
         """Store the tags currently held in the ``tags`` attribute into the file.
 
         If some tags cannot be stored because the underlying metadata format does not support them,
         the unsuccessful tags are returned as a "sub-dictionary" of ``self.tags`` which will be
-        empty if everything is ok.
+        empty if everything is ok. If ``tags`` was never accessed, the tags in the file are left
+        as they are. After saving, the contents of ``tags`` are replaced by the tags read back from
+        the file, which reflect how TagLib stored the values (e.g. "01" as track number "1" in MP4
+        files).
+
+        If nothing was modified (see ``is_modified``), the file is not written at all unless
+        ``force`` is True. The ``written`` attribute of the result tells whether a write happened.
+
+        TagLib reserves padding after ID3v2 tags (at least 1 KB) and in FLAC files (at least 4 KB),
+        and reuses existing padding when saving. As long as the tags still fit, only the tags are
+        overwritten; otherwise, the audio data following them has to be rewritten. The ``in_place``
+        attribute of the result tells whether the file kept its size; for formats with tags at the
+        end of the file, a size change does not move the audio data (see ``SaveResult``).
+
+        Args:
+            force: Write the file even if nothing was modified.
 
         Returns:
-            Dict of tags that could not be saved (empty if all saved successfully).
+            SaveResult (a dict) of tags that could not be saved (empty if all saved successfully).
 
         Raises:
             OSError: If the save operation fails completely (file does not exist,
                 insufficient rights, ...).
             ValueError: When attempting to save after the file was closed.
         """
-        self.check_writable()
         cdef:
             ctypes.PropertyMap cTagdict, cRemaining
             ctypes.String cKey, cValue
+            bint success, setTags
+            double start
+        with self.lock:
+            self.check_writable()
+            setTags = self.tags_modified()
+            if not (force or setTags or self.complex_modified):
+                return SaveResult(written=False)
+
+            # populate cTagdict with the contents of self.tags
+            if setTags:
+                if self.keys is not None:
+                    # only the selected keys were read; keep all others as they are
+                    cTagdict = self.cTags
+                    for key in self.keys:
+                        cTagdict.erase(toCStr(key))
+                    for key in self._tags:
+                        cTagdict.erase(toCStr(key.upper()))
+                for key, values in self._tags.items():
+                    cKey = toCStr(key.upper())
+                    if isinstance(values, (bytes, str)):
+                        # the user has accidentally used a single tag value instead a length-1 list
+                        values = [values]
+                    for value in values:
+                        cTagdict[cKey].append(toCStr(value))
+
+            size = self.file_size()
+            start = perf_counter() if stats_enabled else 0
+            success = False
+            try:
+                with nogil:
+                    if setTags:
+                        cRemaining = self.cFile.setProperties(cTagdict)
+                    success = self.cFile.save()
+            finally:
+                if stats_enabled:
+                    count_save(self.fileobj if self.fileobj is not None else self.path,
+                               perf_counter() - start, success)
+            if self.path is not None and _caches:
+                invalidate_caches(self.path)
+            if not success:
+                raise OSError('Unable to save tags: Unknown OS error')
+            with nogil:
+                cTagdict = self.cFile.properties()
+            self.cTags = cTagdict
+            if self._tags is not None:
+                # TagLib may have normalized or dropped values; update the dict callers may hold
+                self._tags.clear()
+                self._tags.update(propertyMapToDict(self.cTags, self.keys))
+            self._unsupported = None
+            self.complex_modified = False
+            if self.path is not None:
+                # our own changes must not trigger refresh_if_changed
+                self.file_stat = stat_signature(self.path)
+            return SaveResult(propertyMapToDict(cRemaining), in_place=self.file_size() == size)
+
+    cdef object file_size(self):
+        """Current size of the underlying file in bytes."""
+        if self.fileobj is None:
+            return os.stat(self.path).st_size
+        position = self.fileobj.tell()
+        try:
+            return self.fileobj.seek(0, os.SEEK_END)
+        finally:
+            self.fileobj.seek(position)
+
+    def reload(self) -> None:
+        """Re-read the file, keeping this File object.
+
+        The tags and audio properties are parsed again from the file (or file object) with the
+        same ``read_style``, ``keys`` and ``io`` as when it was opened. Unsaved changes to ``tags``
+        and pictures are discarded.
 
-        # populate cTagdict with the contents of self.tags
-        for key, values in self.tags.items():
-            cKey = toCStr(key.upper())
-            if isinstance(values, (bytes, str)):
-                # the user has accidentally used a single tag value instead a length-1 list
-                values = [values]
-            for value in values:
-                cTagdict[cKey].append(toCStr(value))
-
-        cRemaining = self.cFile.setProperties(cTagdict)
-        success = self.cFile.save()
-        if not success:
-            raise OSError('Unable to save tags: Unknown OS error')
-        return propertyMapToDict(cRemaining)
+        Raises:
+            OSError: If the file cannot be read anymore. The File is closed in this case.
+            ValueError: If the file is closed.
+        """
+        with self.lock:
+            self.check_closed()
+            self.release()
+            self.open_file()
+            self.readProperties()
+
+    def refresh_if_changed(self) -> bool:
+        """Re-read the file if it was modified since it was opened, saved or reloaded.
+
+        Changes are detected by comparing the size, modification time and inode of the file,
+        so checking an unchanged file costs just a ``stat()`` call. Unsaved changes to ``tags``
+        and pictures are discarded if the file is re-read.
+
+        Returns:
+            True if the file was changed and has been re-read, False otherwise.
+
+        Raises:
+            OSError: If the file does not exist anymore or cannot be read. If it cannot be read,
+                the File is closed.
+            ValueError: If the file is closed, or was opened from a file object, whose changes
+                cannot be detected (use ``reload`` instead).
+        """
+        with self.lock:
+            self.check_closed()
+            if self.fileobj is not None:
+                raise ValueError('cannot detect changes of a file object; use reload() instead')
+            if stat_signature(self.path) == self.file_stat:
+                return False
+            self.reload()
+            return True
 
     def removeUnsupportedProperties(self, properties):
         """This is a direct binding for the corresponding TagLib method."""
-        if not self.cFile:
-            raise ValueError('I/O operation on closed file.')
         cdef ctypes.StringList cProps
         for value in properties:
             cProps.append(toCStr(value))
-        self.cFile.removeUnsupportedProperties(cProps)
+        with self.lock:
+            self.check_closed()
+            self.complex_modified = True
+            self.cFile.removeUnsupportedProperties(cProps)
 
     @property
     def complex_property_keys(self) -> Iterable[str]:
@@ -203,18 +558,22 @@ cdef class File:
         Yields:
             Keys of available complex properties.
         """
-        self.check_closed()
         cdef:
-            ctypes.StringList keys = self.cFile.complexPropertyKeys()
+            ctypes.StringList keys
             ctypes.String key
+        with self.lock:
+            self.check_closed()
+            keys = self.cFile.complexPropertyKeys()
         for key in keys:
             yield toStr(key)
 
-    def complex_properties(self, key: str) -> Sequence[VariantMap]:
+    def complex_properties(self, key: str, copy: bool = True) -> Sequence[VariantMap]:
         """Get complex properties for a given key (e.g., "PICTURE").
 
         Args:
             key: The complex property key to retrieve.
+            copy: If False, binary data (such as picture data) is returned as read-only
+                memoryview of TagLib's buffer instead of being copied into a bytes object.
 
         Returns:
             Sequence of variant maps containing the complex property data.
@@ -222,9 +581,14 @@ cdef class File:
         Raises:
             ValueError: If the file is closed.
         """
-        self.check_closed()
-        cdef ctypes.List[ctypes.VariantMap] props = self.cFile.complexProperties(toCStr(key))
-        return variant_map_to_list(props)
+        cdef:
+            ctypes.String cKey = toCStr(key)
+            ctypes.List[ctypes.VariantMap] props
+        with self.lock:
+            self.check_closed()
+            with nogil:
+                props = self.cFile.complexProperties(cKey)
+        return variant_map_to_list(props, copy)
 
     def set_complex_properties(self, key: str, value: Iterable[VariantMap]) -> bool:
         """Set complex properties for a given key (e.g., "PICTURE").
@@ -242,9 +606,23 @@ cdef class File:
             ValueError: If the file is closed.
             OSError: If the file is read-only.
         """
-        self.check_writable()
-        cdef ctypes.List[ctypes.VariantMap] cProps = list_to_variant_map_list(list(value))
-        return self.cFile.setComplexProperties(toCStr(key), cProps)
+        cdef:
+            ctypes.String cKey
+            ctypes.List[ctypes.VariantMap] cProps
+            cppbool success = True
+            cppbool unchanged
+        with self.lock:
+            self.check_writable()
+            cKey = toCStr(key)
+            cProps = list_to_variant_map_list(list(value))
+            with nogil:
+                # compared in C++, so the current properties are not converted to Python objects
+                unchanged = self.cFile.complexProperties(cKey) == cProps
+                if not unchanged:
+                    success = self.cFile.setComplexProperties(cKey, cProps)
+            if success and not unchanged:
+                self.complex_modified = True
+        return success
 
     @property
     def pictures(self) -> list[Picture]:
@@ -255,7 +633,7 @@ cdef class File:
         Returns:
             List of Picture objects, empty if no pictures embedded.
         """
-        return [Picture._from_variant_map(d) for d in self.complex_properties('PICTURE')]
+        return self.get_pictures()
 
     @pictures.setter
     def pictures(self, value: Iterable[Picture]) -> None:
@@ -270,22 +648,61 @@ cdef class File:
         """
         self.set_complex_properties('PICTURE', [p._to_variant_map() for p in value])
 
+    def get_pictures(self, copy: bool = True) -> list[Picture]:
+        """Get embedded pictures (cover art) from the file, optionally without copying image data.
+
+        Args:
+            copy: If False, the ``data`` of the returned pictures is a read-only memoryview of
+                TagLib's buffer instead of a bytes copy. This saves copying large images if you only
+                need to hash them or write them to disk. The view remains valid after the file
+                is closed.
+
+        Returns:
+            List of Picture objects, empty if no pictures embedded.
+        """
+        return [Picture._from_variant_map(d) for d in self.complex_properties('PICTURE', copy)]
+
+    @property
+    def picture_info(self) -> list[PictureInfo]:
+        """Get type, size and other metadata of embedded pictures without loading their data.
+
+        Use this to decide whether a file needs new cover art; the image data of each picture can
+        still be loaded on demand with ``PictureInfo.data`` or ``PictureInfo.to_picture()``.
+
+        Returns:
+            List of PictureInfo objects, empty if no pictures embedded.
+        """
+        return [PictureInfo._from_variant_map(d) for d in self.complex_properties('PICTURE', False)]
+
     def close(self):
         """Close the file by deleting the underlying Taglib::File object.
 
-        Calling any method on the file after calling close will raise an exception.
+        Calling any method on the file after calling close will raise an exception. A file object
+        passed to the constructor is not closed.
 
         Raises:
             ValueError: If the file is already closed.
         """
-        if self.is_closed:
-            raise ValueError("File already closed")
-        del self.cFile
-        self.cFile = NULL
+        with self.lock:
+            if self.is_closed:
+                raise ValueError("File already closed")
+            self.release()
 
     def __dealloc__(self):
+        # no other reference exists anymore, so the lock is not needed
+        self.release()
+
+    cdef void release(self) noexcept:
+        """Delete the TagLib::FileRef and the stream it reads from, if any."""
         if self.cFile:
             del self.cFile
+            self.cFile = NULL
+        if self.cStream:
+            del self.cStream
+            self.cStream = NULL
+        if self.mapping is not None:
+            PyBuffer_Release(&self.mapped)
+            self.mapping = None
 
     @property
     def is_closed(self) -> bool:
@@ -293,28 +710,36 @@ cdef class File:
 
     @property
     def length(self) -> float:
-        self.check_closed()
-        return self.cFile.audioProperties().lengthInMilliseconds() / 1_000.0
+        with self.lock:
+            return self.audio_properties().lengthInMilliseconds() / 1_000.0
 
     @property
     def bitrate(self) -> int:
-        self.check_closed()
-        return self.cFile.audioProperties().bitrate()
+        with self.lock:
+            return self.audio_properties().bitrate()
 
     @property
     def sampleRate(self) -> int:
-        self.check_closed()
-        return self.cFile.audioProperties().sampleRate()
+        with self.lock:
+            return self.audio_properties().sampleRate()
 
     @property
     def channels(self) -> int:
-        self.check_closed()
-        return self.cFile.audioProperties().channels()
+        with self.lock:
+            return self.audio_properties().channels()
 
     @property
     def readOnly(self) -> bool:
+        with self.lock:
+            self.check_closed()
+            return self.cFile.file().readOnly()
+
+    cdef ctypes.AudioProperties* audio_properties(self) except NULL:
         self.check_closed()
-        return self.cFile.file().readOnly()
+        cdef ctypes.AudioProperties* properties = self.cFile.audioProperties()
+        if properties is NULL:
+            raise ValueError(f'Audio properties not available (read_style={self.read_style!r})')
+        return properties
 
     cdef void check_closed(self):
         if self.is_closed:
@@ -333,8 +758,80 @@ cdef class File:
         self.close()
 
     def __repr__(self) -> str:
+        if self.fileobj is not None:
+            return f"File({self.fileobj!r})"
         return f"File('{self.path}')"
 
+cdef object as_path(path):
+    """Convert a str, bytes or os.PathLike object to a Path, decoding bytes as UTF-8."""
+    if isinstance(path, Path):
+        return path
+    if isinstance(path, bytes):
+        path = path.decode('utf-8')
+    return Path(path)
+
+
+cdef dict normalize_tags(dict tags, bint keep_empty = False):
+    """Normalize a tags dict the way ``File.save`` interprets it, for comparison with tags read
+    from a file: upper-case str keys mapping to lists of str values.
+
+    Keys with an empty (or None) value are dropped unless ``keep_empty`` is true.
+    """
+    cdef dict result = {}
+    for key, values in tags.items():
+        if isinstance(values, (bytes, str)):
+            values = [values]
+        elif values is None:
+            values = []
+        if not values and not keep_empty:
+            continue
+        if isinstance(key, bytes):
+            key = key.decode('utf-8', 'replace')
+        result.setdefault(key.upper(), []).extend(
+            value.decode('utf-8', 'replace') if isinstance(value, bytes) else value for value in values)
+    return result
+
+
+cdef tuple normalize_keys(keys):
+    """Convert an iterable of tag names into a sorted tuple of unique upper-case names."""
+    if keys is None:
+        return None
+    if isinstance(keys, (str, bytes)):
+        keys = [keys]
+    return tuple(sorted({key.decode('utf-8').upper() if isinstance(key, bytes) else key.upper()
+                         for key in keys}))
+
+
+cdef bint is_fileobj(source):
+    """Check if ``source`` is a (binary) file object rather than a path."""
+    return hasattr(source, 'read') and hasattr(source, 'seek')
+
+
+cdef tuple stat_signature(path):
+    """Size, modification time (in ns) and inode of the file at ``path``, to detect changes."""
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+cdef object map_file(path):
+    """Memory-map the file at ``path`` read-only."""
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # raised for empty files, which can't be mapped
+            raise OSError(f'Could not read file {path}') from e
+
+
+cdef void check_io(str io):
+    if io not in ('stream', 'mmap'):
+        raise ValueError(f'io must be "stream" or "mmap", not {io!r}')
+
+
+cdef void check_read_style(str read_style):
+    if read_style not in _read_styles:
+        raise ValueError(f'read_style must be one of {", ".join(_read_styles)}, not {read_style!r}')
+
+
 def taglib_version() -> tuple[int, int]:
     """Get Taglib major and minor version as a 2-tuple.
 
@@ -347,3 +844,28 @@ def taglib_version() -> tuple[int, int]:
         Tuple of (major_version, minor_version).
     """
     return ctypes.TAGLIB_MAJOR_VERSION, ctypes.TAGLIB_MINOR_VERSION
+
+
+_supported_extensions = None
+
+
+def supported_extensions() -> frozenset[str]:
+    """Get the file name extensions of all formats supported by TagLib.
+
+    Returns:
+        Set of lower-case extensions without leading dot, e.g. ``{'mp3', 'flac', ...}``.
+    """
+    global _supported_extensions
+    if _supported_extensions is None:
+        _supported_extensions = frozenset(
+            toStr(extension).lower() for extension in ctypes.FileRef.defaultFileExtensions())
+    return _supported_extensions
+
+
+include "_batch.pxi"
+include "_metadata.pxi"
+include "_probe.pxi"
+include "_detect.pxi"
+include "_aio.pxi"
+include "_cache.pxi"
+include "_export.pxi"
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+import taglib
+import taglib.aio
+from taglib import aio
+
+FILES = ["r2.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg"]
+
+
+def test_import_aio():
+    assert taglib.aio is aio
+
+
+def test_import_taglib_does_not_import_asyncio():
+    code = "import sys, taglib; print('asyncio' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+    from taglib.aio import read, read_many, save  # noqa: F401
+
+
+def test_read(test_data):
+    path = test_data("issue19.flac")
+    result = asyncio.run(aio.read(path))
+    with taglib.File(path) as f:
+        assert result.tags == f.tags
+        assert result.length == f.length
+
+
+def test_read_missing_file_raises(tmp_path):
+    with pytest.raises(OSError):
+        asyncio.run(aio.read(tmp_path / "missing.mp3"))
+
+
+def test_save_updates_given_tags_only(test_data, tiny_png):
+    path = test_data("issue19.flac")
+    picture = taglib.Picture(data=tiny_png, mime_type="image/png")
+    result = asyncio.run(aio.save(path, {"genre": ["Jazz"], "COMMENT": None}, pictures=[picture]))
+    assert result == {}
+    assert result.written
+    with taglib.File(path) as f:
+        assert f.tags["GENRE"] == ["Jazz"]
+        assert "COMMENT" not in f.tags
+        assert f.tags["ARTIST"] == ["This is an artist"]
+        assert f.pictures[0].data == tiny_png
+
+
+def test_read_many(test_data, tmp_path):
+    paths = [test_data(name) for name in FILES] + [tmp_path / "missing.mp3"]
+
+    async def read_all():
+        return [result async for result in aio.read_many(paths * 3, workers=2, ordered=True)]
+
+    results = asyncio.run(read_all())
+    assert [result.path for result in results] == paths * 3
+    assert [result.ok for result in results] == [True, True, True, True, False] * 3
+
+
+def test_read_many_from_async_iterable(test_data):
+    paths = [test_data(name) for name in FILES]
+
+    async def generate_paths():
+        for path in paths:
+            await asyncio.sleep(0)
+            yield path
+
+    async def read_all():
+        return [result async for result in aio.read_many(generate_paths(), workers=2)]
+
+    results = asyncio.run(read_all())
+    assert sorted(result.path for result in results) == sorted(paths)
+
+
+def test_read_many_stop_early(test_data):
+    paths = [test_data(name) for name in FILES] * 10
+
+    async def read_first():
+        results = aio.read_many(paths, workers=2)
+        async for result in results:
+            await results.aclose()
+            return result
+
+    assert asyncio.run(read_first()).ok
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+import taglib
+
+FILES = ["r2.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg"]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with taglib.CachedReader(tmp_path / "cache.db") as cache:
+        yield cache
+
+
+def test_cached_result_equals_file(cache, test_data):
+    path = test_data("issue19.flac")
+    first = cache.read(path)
+    second = cache.read(str(path))
+    assert first.ok
+    assert second == first
+    with taglib.File(path) as f:
+        assert second.tags == f.tags
+        assert second.length == f.length
+        assert second.channels == f.channels
+        assert [info.size for info in second.pictures] == [info.size for info in f.picture_info]
+
+
+def test_unchanged_file_is_not_parsed(cache, test_data, monkeypatch):
+    path = test_data("r2.mp3")
+    cache.read(path)
+    monkeypatch.setattr(taglib, "_read_one", None)  # would fail if called
+    assert cache.read(path).tags["TITLE"] == ["I Can Walk On Water I Can Fly"]
+
+
+def test_cache_persists(tmp_path, test_data):
+    paths = [test_data(name) for name in FILES]
+    with taglib.CachedReader(tmp_path / "cache.db") as cache:
+        first = sorted(cache.read_many(paths, workers=2), key=lambda result: result.path)
+    with taglib.CachedReader(tmp_path / "cache.db") as cache:
+        assert len(cache) == len(FILES)
+        assert sorted(cache.read_many(paths, workers=2), key=lambda result: result.path) == first
+
+
+def test_modified_file_is_reparsed(cache, test_data):
+    path = test_data("r2.mp3")
+    cache.read(path)
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = ["Changed"]
+        f.save()
+    assert cache.read(path).tags["TITLE"] == ["Changed"]
+
+
+def test_save_invalidates_entry(cache, test_data):
+    path = test_data("r2.mp3")
+    cache.read(path)
+    assert len(cache) == 1
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = ["Changed"]
+        f.save()
+    assert len(cache) == 0
+
+
+def test_file_changed_while_cache_closed_is_reparsed(tmp_path, test_data):
+    path = test_data("r2.mp3")
+    with taglib.CachedReader(tmp_path / "cache.db") as cache:
+        cache.read(path)
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = ["Changed"]
+        f.save()
+    with taglib.CachedReader(tmp_path / "cache.db") as cache:
+        assert cache.read(path).tags["TITLE"] == ["Changed"]
+
+
+def test_errors_are_not_cached(cache, tmp_path):
+    result = cache.read(tmp_path / "missing.mp3")
+    assert isinstance(result.error, OSError)
+    assert len(cache) == 0
+
+
+def test_eviction(tmp_path, test_data):
+    paths = [test_data(name) for name in FILES]
+    with taglib.CachedReader(tmp_path / "cache.db", max_entries=2) as cache:
+        for path in paths:
+            cache.read(path)
+            assert len(cache) <= 2
+        assert cache.read(paths[-1]).ok
+
+
+def test_eviction_keeps_recently_used(tmp_path, test_data, monkeypatch):
+    paths = [test_data(name) for name in FILES]
+    with taglib.CachedReader(tmp_path / "cache.db", max_entries=3) as cache:
+        for path in paths[:3]:
+            cache.read(path)
+        cache.read(paths[0])
+        cache.read(paths[3])  # evicts down to two entries
+        assert len(cache) == 2
+        monkeypatch.setattr(taglib, "_read_one", None)  # would fail if called
+        assert cache.read(paths[0]).ok
+        assert cache.read(paths[3]).ok
+
+
+def test_cache_hit_does_not_write_database(cache, test_data):
+    path = test_data("r2.mp3")
+    cache.read(path)
+    wal = cache.db_path.with_name("cache.db-wal")
+    size = wal.stat().st_size
+    for _ in range(10):
+        cache.read(path)
+    assert wal.stat().st_size == size
+
+
+def test_save_ignores_cache_errors(cache, test_data, monkeypatch):
+    def fail(path):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache, "invalidate", fail)
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = ["Changed"]
+        assert f.save().written
+
+
+def test_read_many_reports_cache_errors(cache, test_data, monkeypatch):
+    paths = [test_data(name) for name in FILES]
+
+    def fail(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache, "_store", fail)
+    results = list(cache.read_many(paths, workers=2))
+    assert len(results) == len(paths)
+    assert all(isinstance(result.error, sqlite3.OperationalError) for result in results)
+
+
+def test_read_many_when_closed_during_iteration(cache, test_data):
+    paths = [test_data(name) for name in FILES] * 10
+    results = []
+    for result in cache.read_many(paths, workers=1, ordered=True):
+        results.append(result)
+        cache.close()
+    assert len(results) == len(paths)
+    assert results[0].ok
+    assert isinstance(results[-1].error, ValueError)
+
+
+def test_import_taglib_does_not_import_sqlite3():
+    code = "import sys, taglib; print('sqlite3' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+
+
+def test_cached_picture_has_no_data(cache, test_data, tiny_png):
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        f.pictures = [taglib.Picture(data=tiny_png, mime_type="image/png")]
+        f.save()
+    info, = cache.read(path).pictures
+    assert info.size == len(tiny_png)
+    assert info.mime_type == "image/png"
+    with pytest.raises(ValueError):
+        info.data
+
+
+def test_closed_cache(tmp_path, test_data):
+    cache = taglib.CachedReader(tmp_path / "cache.db")
+    cache.close()
+    cache.close()
+    with pytest.raises(ValueError):
+        cache.read(test_data("r2.mp3"))
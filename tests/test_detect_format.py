@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import io
+from pathlib import Path
+
+import pytest
+
+import taglib
+
+DATA = Path(__file__).parent / "data"
+
+FORMATS = {
+    "onlyv1.mp3": "MPEG",
+    "r2.mp3": "MPEG",
+    "xing.mp3": "MPEG",
+    "issue19.flac": "FLAC",
+    "no-tags.flac": "FLAC",
+    "has-tags.m4a": "MP4",
+    "issue46.m4a": "MP4",
+    "lowercase-fields.ogg": "OggVorbis",
+}
+
+
+@pytest.mark.parametrize("filename,format", FORMATS.items())
+def test_detect_format_of_path(filename, format):
+    assert taglib.detect_format(DATA / filename) == format
+    assert taglib.detect_format(str(DATA / filename)) == format
+    assert taglib.detect_format(str(DATA / filename).encode("utf-8")) == format
+
+
+@pytest.mark.parametrize("filename", ["r2.mp3", "issue19.flac", "lowercase-fields.ogg"])
+def test_detect_format_agrees_with_probe(test_data, filename):
+    path = test_data(filename)
+    assert taglib.detect_format(path) == taglib.probe(path).format
+
+
+def test_detect_format_of_content():
+    data = (DATA / "issue19.flac").read_bytes()
+    assert taglib.detect_format(data=data) == "FLAC"
+    assert taglib.detect_format(data=bytearray(data[:100])) == "FLAC"
+    assert taglib.detect_format(data=memoryview(data)[:100]) == "FLAC"
+
+
+def test_detect_format_of_file_object():
+    stream = io.BytesIO((DATA / "has-tags.m4a").read_bytes())
+    stream.seek(123)
+    assert taglib.detect_format(stream) == "MP4"
+    assert stream.tell() == 123
+
+
+@pytest.mark.parametrize("head,format", [
+    (b"RIFF\x00\x00\x00\x00WAVEfmt ", "WAV"),
+    (b"FORM\x00\x00\x00\x00AIFFCOMM", "AIFF"),
+    (b"FORM\x00\x00\x00\x00AIFCFVER", "AIFF"),
+    (b"MAC \x96\x0f\x00\x00", "APE"),
+    (b"wvpk\x00\x00\x00\x00", "WavPack"),
+    (bytes.fromhex("3026b2758e66cf11a6d900aa0062ce6c"), "ASF"),
+    (b"ID3\x04\x00\x00\x00\x00\x00\x02\x00\x00fLaC\x00\x00\x00\x22", "FLAC"),
+    (b"ID3\x04\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00", "MPEG"),
+    (b"OggS\x00\x02" + bytes(20) + b"\x01\x13OpusHead\x01\x02", "OggOpus"),
+    (b"not an audio file", None),
+    (b"", None),
+])
+def test_detect_format_signatures(head, format):
+    assert taglib.detect_format(data=head) == format
+
+
+def test_detect_format_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        taglib.detect_format(tmp_path / "missing.mp3")
+
+
+def test_detect_format_requires_source_or_data():
+    with pytest.raises(TypeError):
+        taglib.detect_format()
+    with pytest.raises(TypeError):
+        taglib.detect_format(DATA / "r2.mp3", data=b"ID3")
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import os
+
+import taglib
+from taglib import Picture
+
+
+def _touch_old(path):
+    """Set the modification time of *path* into the past, so that any write changes it."""
+    os.utime(path, ns=(0, 0))
+    return os.stat(path).st_mtime_ns
+
+
+def test_unchanged_file_is_not_written(test_data):
+    path = test_data("r2.mp3")
+    mtime = _touch_old(path)
+    with taglib.File(path) as f:
+        _ = f.tags
+        assert not f.is_modified
+        result = f.save()
+    assert result == {}
+    assert not result.written
+    assert os.stat(path).st_mtime_ns == mtime
+
+
+def test_save_on_exit_skips_unchanged_file(test_data):
+    path = test_data("r2.mp3")
+    mtime = _touch_old(path)
+    with taglib.File(path, save_on_exit=True) as f:
+        f.tags["TITLE"] = list(f.tags["TITLE"])
+        f.pictures = []
+    assert os.stat(path).st_mtime_ns == mtime
+
+
+def test_changed_tags_are_written(test_data):
+    path = test_data("r2.mp3")
+    mtime = _touch_old(path)
+    with taglib.File(path) as f:
+        f.tags["artist"] = "somebody"
+        assert f.is_modified
+        result = f.save()
+        assert result.written
+        assert not f.is_modified
+        assert not f.save().written
+    assert os.stat(path).st_mtime_ns != mtime
+
+
+def test_normalized_values_are_not_modified_after_save(test_data):
+    path = test_data("has-tags.m4a")
+    with taglib.File(path) as f:
+        f.tags["TRACKNUMBER"] = ["01"]
+        f.save()
+        assert not f.is_modified
+        assert f.tags["TRACKNUMBER"] == ["1"]
+        mtime = _touch_old(path)
+        assert not f.save().written
+    assert os.stat(path).st_mtime_ns == mtime
+
+
+def test_tags_dict_stays_valid_across_saves(test_data):
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        tags = f.tags
+        tags["A"] = ["1"]
+        assert f.save().written
+        tags["B"] = ["2"]
+        assert f.save().written
+        assert f.tags is tags
+    with taglib.File(path) as f:
+        assert f.tags["A"] == ["1"]
+        assert f.tags["B"] == ["2"]
+
+
+def test_changed_pictures_are_written(test_data, tiny_png):
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        f.pictures = [Picture(data=tiny_png, mime_type="image/png")]
+        assert f.is_modified
+        assert f.save().written
+        f.pictures = [Picture(data=tiny_png, mime_type="image/png")]
+        assert not f.is_modified
+
+
+def test_force_save(test_data):
+    path = test_data("r2.mp3")
+    mtime = _touch_old(path)
+    with taglib.File(path) as f:
+        assert f.save(force=True).written
+    assert os.stat(path).st_mtime_ns != mtime
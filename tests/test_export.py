@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import csv
+import shutil
+from pathlib import Path
+
+import pytest
+
+import taglib
+from taglib import export
+
+DATA = Path(__file__).parent / "data"
+FILES = ["r2.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg"]
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "library"
+    (root / "sub").mkdir(parents=True)
+    for name in FILES:
+        shutil.copyfile(DATA / name, root / "sub" / name)
+    (root / "broken.flac").write_bytes(b"no audio")
+    (root / "cover.jpg").write_bytes(b"no audio")
+    return root
+
+
+def test_import_export():
+    import taglib.export as module
+    assert module is taglib.export is export
+
+
+def test_rows(library):
+    rows = {Path(row["path"]).name: row for row in export.rows([library], keys=["title", "ARTIST"])}
+    assert set(rows) == {*FILES, "broken.flac"}
+    assert rows["r2.mp3"]["TITLE"] == ["I Can Walk On Water I Can Fly"]
+    assert rows["issue19.flac"]["length"] > 0
+    assert rows["issue19.flac"]["error"] is None
+    assert rows["broken.flac"]["error"]
+    assert rows["broken.flac"]["TITLE"] is None
+
+
+def test_write_csv(library, tmp_path):
+    target = tmp_path / "library.csv"
+    assert export.write([library], target, keys=["TITLE", "GENRE"]) == len(FILES) + 1
+    with open(target, newline="", encoding="utf-8") as f:
+        rows = {Path(row["path"]).name: row for row in csv.DictReader(f)}
+    assert list(next(iter(rows.values()))) == [
+        "path", "TITLE", "GENRE", "length", "bitrate", "sampleRate", "channels", "error"]
+    assert rows["r2.mp3"]["TITLE"] == "I Can Walk On Water I Can Fly"
+    assert rows["broken.flac"]["error"]
+
+
+def test_unknown_format(library, tmp_path):
+    with pytest.raises(ValueError):
+        export.write([library], tmp_path / "library.xyz")
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+def test_write_arrow(library, tmp_path, suffix):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+    target = tmp_path / f"library{suffix}"
+    assert export.write([library], target, keys=["TITLE"], chunk_size=2) == len(FILES) + 1
+    if suffix == ".parquet":
+        table = pa.parquet.read_table(target)
+    else:
+        table = pa.ipc.open_file(target).read_all()
+    assert table.num_rows == len(FILES) + 1
+    rows = {Path(row["path"]).name: row for row in table.to_pylist()}
+    assert rows["r2.mp3"]["TITLE"] == ["I Can Walk On Water I Can Fly"]
+    assert rows["r2.mp3"]["sampleRate"] > 0
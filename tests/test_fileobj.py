@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import io
+
+import pytest
+
+import taglib
+
+
+@pytest.mark.parametrize("filename", ["r2.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg"])
+def test_read_from_bytes(test_data, filename):
+    path = test_data(filename)
+    with taglib.File(path) as f:
+        expected = f.tags, f.length
+    with taglib.File.from_bytes(path.read_bytes()) as f:
+        assert f.path is None
+        assert isinstance(f.fileobj, io.BytesIO)
+        assert (f.tags, f.length) == expected
+
+
+@pytest.mark.parametrize("filename", ["r2.mp3", "issue19.flac", "lowercase-fields.ogg"])
+def test_save_writes_into_buffer(test_data, filename):
+    path = test_data(filename)
+    buffer = io.BytesIO(path.read_bytes())
+    with taglib.File(buffer) as f:
+        f.tags["TITLE"] = ["in memory"]
+        # a large value cannot be written in place, so the stream has to grow
+        f.tags["LYRICS"] = ["la " * 10_000]
+        assert f.save() == {}
+    path.write_bytes(buffer.getvalue())
+    with taglib.File(path) as f:
+        assert f.tags["TITLE"] == ["in memory"]
+        assert f.tags["LYRICS"] == ["la " * 10_000]
+
+
+def test_shrinking_tags_in_buffer(test_data):
+    data = test_data("issue19.flac").read_bytes()
+    with taglib.File.from_bytes(data) as f:
+        f.tags = {}
+        f.save()
+        shrunk = f.fileobj.getvalue()
+    with taglib.File.from_bytes(shrunk) as f:
+        assert f.tags == {}
+        assert f.length == pytest.approx(3.685, abs=0.01)
+
+
+def test_read_only_file_object(test_data):
+    path = test_data("r2.mp3")
+    with open(path, "rb") as stream, taglib.File(stream) as f:
+        assert f.readOnly
+        assert f.tags["TITLE"] == ["I Can Walk On Water I Can Fly"]
+        f.tags["TITLE"] = ["changed"]
+        with pytest.raises(OSError):
+            f.save()
+
+
+def test_writable_file_object(test_data):
+    path = test_data("r2.mp3")
+    with open(path, "r+b") as stream:
+        with taglib.File(stream) as f:
+            f.tags["TITLE"] = ["changed"]
+            f.save()
+        assert not stream.closed
+    with taglib.File(path) as f:
+        assert f.tags["TITLE"] == ["changed"]
+
+
+def test_invalid_data_raises():
+    with pytest.raises(OSError):
+        taglib.File.from_bytes(b"this is not an audio file")
+
+
+def test_mmap_requires_path(test_data):
+    stream = io.BytesIO(test_data("r2.mp3").read_bytes())
+    with pytest.raises(ValueError):
+        taglib.File(stream, io="mmap")
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+"""Stress tests for sharing File objects between threads.
+
+Every File serializes access to its native TagLib object with a lock, so concurrent calls must
+neither crash nor corrupt the file, with or without the GIL. How reading independent files scales
+with the number of threads on free-threaded builds (python3.13t and later) is measured by
+``benchmarks/test_thread_scaling.py``.
+"""
+import os
+import sys
+import sysconfig
+import threading
+
+import pytest
+
+import taglib
+
+FILES = ["r2.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg"]
+THREADS = 8
+
+
+def gil_enabled():
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def run_concurrently(target, count=THREADS):
+    """Run ``target(i)`` on ``count`` threads started at the same time; re-raise the first error."""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(i):
+        barrier.wait()
+        try:
+            target(i)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+@pytest.mark.skipif(not sysconfig.get_config_var("Py_GIL_DISABLED"), reason="requires a free-threaded Python build")
+@pytest.mark.skipif(os.environ.get("PYTHON_GIL") == "1", reason="GIL enabled by PYTHON_GIL")
+def test_import_keeps_gil_disabled():
+    # importing an extension module that does not declare free-threading support enables the GIL
+    assert not gil_enabled()
+
+
+def test_concurrent_close(test_data):
+    for _ in range(20):
+        f = taglib.File(test_data("r2.mp3"))
+        closed = []
+
+        def close(i):
+            try:
+                f.close()
+                closed.append(i)
+            except ValueError:
+                pass
+
+        run_concurrently(close)
+        assert len(closed) == 1
+        assert f.is_closed
+
+
+@pytest.mark.parametrize("filename", FILES)
+def test_concurrent_read_save_close(test_data, filename):
+    path = test_data(filename)
+    with taglib.File(path) as f:
+        expected_length = f.length
+    for _ in range(5):
+        f = taglib.File(path)
+
+        def work(i):
+            for j in range(20):
+                try:
+                    if i == 0 and j == 10:
+                        f.close()
+                    elif i % 3 == 0:
+                        f.tags["TITLE"] = [f"thread {i}, round {j}"]
+                        f.save()
+                    elif i % 3 == 1:
+                        assert f.length == expected_length
+                        f.picture_info
+                    else:
+                        f.tags.get("TITLE")
+                        f.is_modified
+                except ValueError:
+                    assert f.is_closed
+
+        run_concurrently(work)
+        assert f.is_closed
+    with taglib.File(path) as f:
+        assert f.tags["TITLE"][0].startswith("thread ")
+        assert f.length == expected_length
+
+
+def test_shared_file_reads(test_data):
+    with taglib.File(test_data("issue19.flac")) as f:
+        expected = f.tags, f.length, f.pictures
+
+        def read(i):
+            for _ in range(50):
+                assert (f.tags, f.length, f.pictures) == expected
+
+        run_concurrently(read)
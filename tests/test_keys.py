@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import taglib
+
+
+def test_keys_limit_tags(test_data):
+    f = taglib.File(test_data("issue19.flac"), keys={"artist", "TITLE", "NOTPRESENT"})
+    assert f.keys == ("ARTIST", "NOTPRESENT", "TITLE")
+    assert f.tags == {"ARTIST": ["This is an artist"], "TITLE": ["issue19.flac"]}
+    f.close()
+
+
+def test_save_with_keys_keeps_other_tags(test_data):
+    path = test_data("issue19.flac")
+    with taglib.File(path, keys=["ARTIST", "TITLE"]) as f:
+        f.tags["ARTIST"] = ["new artist"]
+        del f.tags["TITLE"]
+        f.tags["GENRE"] = ["Rock"]
+        assert f.save() == {}
+    with taglib.File(path) as f:
+        assert f.tags == {
+            "ALBUM": ["THis is an album"],
+            "ARTIST": ["new artist"],
+            "COMMENT": ["This is a comment"],
+            "DATE": ["2015"],
+            "GENRE": ["Rock"],
+        }
+
+
+def test_empty_keys_read_no_tags(test_data):
+    f = taglib.File(test_data("r2.mp3"), keys=())
+    assert f.tags == {}
+    assert f.unsupported == ["UFID/supermihi@web.de"]
+    f.close()
+
+
+def test_read_many_with_keys(test_data):
+    [result] = taglib.read_many([test_data("testöü.flac")], keys=["artist"])
+    assert result.tags == {"ARTIST": ["piman", "jzig"]}
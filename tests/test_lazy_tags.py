@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import taglib
+from taglib import Picture
+
+
+def test_tags_available_after_close(test_file):
+    f = test_file("issue19.flac")
+    f.close()
+    assert f.tags["ALBUM"] == ["THis is an album"]
+    assert f.unsupported == []
+
+
+def test_unsupported_is_converted_on_access(test_file):
+    f = test_file("r2.mp3")
+    assert f.unsupported == ["UFID/supermihi@web.de"]
+    assert f.unsupported is f.unsupported
+    f.close()
+
+
+def test_save_without_accessing_tags_keeps_tags(test_data, tiny_png):
+    path = test_data("issue19.flac")
+    with taglib.File(path) as f:
+        f.pictures = [Picture(data=tiny_png, mime_type="image/png")]
+        assert f.save() == {}
+    with taglib.File(path) as f:
+        assert f.tags["ARTIST"] == ["This is an artist"]
+        assert len(f.pictures) == 1
+
+
+def test_assign_tags(test_data):
+    path = test_data("issue19.flac")
+    with taglib.File(path) as f:
+        f.tags = {"TITLE": ["replaced"]}
+        f.save()
+    with taglib.File(path) as f:
+        assert f.tags == {"TITLE": ["replaced"]}
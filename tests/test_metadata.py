@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import pickle
+import tracemalloc
+
+import pytest
+
+import taglib
+from taglib import Metadata
+
+TAGS = {"ARTIST": ["A", "B"], "TITLE": ["Song"], "GENRE": [], "album": ["X"]}
+
+
+def test_mapping():
+    metadata = Metadata("/music/song.mp3", TAGS, length=1.5)
+    assert list(metadata) == ["ALBUM", "ARTIST", "TITLE"]
+    assert metadata["TITLE"] == "Song"
+    assert metadata["ARTIST"] == ("A", "B")
+    assert metadata.get("GENRE") is None
+    assert "GENRE" not in metadata
+    assert metadata.getlist("title") == ["Song"]
+    assert metadata.getlist("GENRE") == []
+    assert metadata.tags == {"ALBUM": ["X"], "ARTIST": ["A", "B"], "TITLE": ["Song"]}
+    assert metadata.path == "/music/song.mp3"
+    assert metadata.length == 1.5
+    with pytest.raises(KeyError):
+        metadata["GENRE"]
+    with pytest.raises(AttributeError):
+        metadata.extra = 1
+
+
+def test_keys_are_shared():
+    first = Metadata(None, {"ARTIST": ["A"], "TITLE": ["B"]})
+    second = Metadata(None, {"TITLE": ["C"], "artist": ["D"]})
+    assert first._keys is second._keys
+
+
+def test_shared_keys_are_bounded(monkeypatch):
+    monkeypatch.setattr(taglib, "_MAX_KEY_TUPLES", 0)
+    first = Metadata(None, {"UNSHARED1": ["a"], "UNSHARED2": ["b"]})
+    second = Metadata(None, {"UNSHARED1": ["c"], "UNSHARED2": ["d"]})
+    assert first._keys is not second._keys
+    assert first._keys == second._keys
+    assert first.getlist("UNSHARED2") == ["b"]
+
+
+def test_pickle():
+    metadata = Metadata("/music/song.mp3", TAGS, 1.5, 128, 44100, 2)
+    restored = pickle.loads(pickle.dumps(metadata))
+    assert restored == metadata
+    assert restored._keys is metadata._keys
+    assert restored.channels == 2
+
+
+def test_from_file(test_file):
+    with test_file("r2.mp3") as f:
+        metadata = Metadata.from_file(f)
+        assert metadata.tags == f.tags
+        assert metadata.length == f.length
+        assert metadata.path == str(f.path)
+
+
+def test_from_result(test_data, tmp_path):
+    result, failed = taglib.read_many([test_data("issue19.flac"), tmp_path / "missing.mp3"], ordered=True)
+    metadata = Metadata.from_result(result)
+    assert metadata.tags == result.tags
+    assert metadata.sampleRate == result.sampleRate
+    with pytest.raises(ValueError):
+        Metadata.from_result(failed)
+
+
+def test_smaller_than_dicts():
+    def allocated(make):
+        tracemalloc.start()
+        records = [make(i) for i in range(1000)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert len(records) == 1000
+        return size
+
+    def tags(i):
+        return {"ARTIST": [f"artist {i}"], "ALBUM": [f"album {i}"], "TITLE": [f"title {i}"],
+                "TRACKNUMBER": [str(i)], "GENRE": ["Rock"], "DATE": ["2001"]}
+
+    as_dicts = allocated(tags)
+    as_metadata = allocated(lambda i: Metadata(None, tags(i)))
+    assert as_metadata < 0.7 * as_dicts
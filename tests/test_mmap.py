@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import pytest
+
+import taglib
+
+FILES = ["r2.mp3", "onlyv1.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg", "Жбж.mp3"]
+
+
+@pytest.mark.parametrize("filename", FILES)
+def test_mmap_reads_same_data_as_stream(test_data, filename):
+    path = test_data(filename)
+    with taglib.File(path) as f:
+        expected = f.tags, f.unsupported, f.length, f.bitrate, f.pictures
+    with taglib.File(path, io="mmap") as f:
+        assert f.io == "mmap"
+        assert (f.tags, f.unsupported, f.length, f.bitrate, f.pictures) == expected
+
+
+def test_mmap_file_is_read_only(test_data):
+    with taglib.File(test_data("r2.mp3"), io="mmap") as f:
+        assert f.readOnly
+        f.tags["TITLE"] = ["changed"]
+        with pytest.raises(OSError):
+            f.save()
+        with pytest.raises(OSError):
+            f.set_complex_properties("PICTURE", ["not a variant map"])
+
+
+def test_mmap_invalid_files(test_data, tmp_path):
+    empty = tmp_path / "empty.mp3"
+    empty.touch()
+    with pytest.raises(OSError):
+        taglib.File(empty, io="mmap")
+    with pytest.raises(OSError):
+        taglib.File(tmp_path / "missing.mp3", io="mmap")
+    with pytest.raises(OSError):
+        taglib.File(tmp_path, io="mmap")
+
+
+def test_invalid_io_raises(test_data):
+    with pytest.raises(ValueError):
+        taglib.File(test_data("r2.mp3"), io="carrier pigeon")
+
+
+def test_read_many_with_mmap(test_data):
+    results = list(taglib.read_many([test_data(name) for name in FILES], io="mmap"))
+    assert all(result.ok for result in results)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import taglib
+from taglib import Picture, PictureInfo
+
+
+def test_picture_info(test_data, tiny_png):
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        f.pictures = [
+            Picture(data=tiny_png, mime_type="image/png", description="front"),
+            Picture(data=tiny_png * 2, mime_type="image/jpeg", picture_type="Back Cover"),
+        ]
+        f.save()
+    with taglib.File(path) as f:
+        front, back = f.picture_info
+    assert isinstance(front, PictureInfo)
+    assert (front.mime_type, front.description, front.picture_type, front.size) == \
+           ("image/png", "front", "Front Cover", len(tiny_png))
+    assert (back.mime_type, back.picture_type, back.size) == ("image/jpeg", "Back Cover", 2 * len(tiny_png))
+    assert "data" not in repr(front)
+
+
+def test_picture_info_loads_data_on_demand(test_data, tiny_png):
+    path = test_data("r2.mp3")
+    picture = Picture(data=tiny_png, mime_type="image/png", description="front")
+    with taglib.File(path) as f:
+        f.pictures = [picture]
+        f.save()
+    with taglib.File(path) as f:
+        [info] = f.picture_info
+    assert info.data == tiny_png
+    assert info.to_picture() == picture
+
+
+def test_picture_info_empty(test_file):
+    f = test_file("no-tags.flac")
+    assert f.picture_info == []
+    f.close()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import dataclasses
+
+import pytest
+
+import taglib
+
+FORMATS = {
+    "r2.mp3": "MPEG",
+    "issue19.flac": "FLAC",
+    "has-tags.m4a": "MP4",
+    "lowercase-fields.ogg": "OggVorbis",
+}
+
+
+@pytest.mark.parametrize("filename,format", FORMATS.items())
+def test_probe(test_data, filename, format):
+    path = test_data(filename)
+    info = taglib.probe(path)
+    assert info.ok
+    assert info.path == path
+    assert info.format == format
+    with taglib.File(path) as f:
+        assert info.length == f.length
+        assert info.bitrate == f.bitrate
+        assert info.sampleRate == f.sampleRate
+        assert info.channels == f.channels
+
+
+def test_probe_details(test_data):
+    mp3 = taglib.probe(test_data("r2.mp3"))
+    assert mp3.codec.startswith("MPEG-")
+    assert mp3.codec.endswith("Layer 3")
+    assert mp3.bits_per_sample is None
+    flac = taglib.probe(test_data("issue19.flac"))
+    assert flac.codec == "FLAC"
+    assert flac.bits_per_sample == 16
+    assert taglib.probe(test_data("lowercase-fields.ogg")).codec == "Vorbis"
+
+
+def test_probe_is_immutable(test_data):
+    info = taglib.probe(test_data("r2.mp3"))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.length = 0
+
+
+def test_probe_errors(tmp_path):
+    with pytest.raises(OSError):
+        taglib.probe(tmp_path / "missing.mp3")
+    with pytest.raises(ValueError):
+        taglib.probe(tmp_path / "missing.mp3", read_style="none")
+
+
+def test_probe_many(test_data, tmp_path):
+    paths = [test_data(name) for name in FORMATS] + [tmp_path / "missing.mp3"]
+    results = list(taglib.probe_many(paths, workers=2, ordered=True))
+    assert [result.format for result in results] == [*FORMATS.values(), None]
+    assert isinstance(results[-1].error, OSError)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+import pyprinttags
+import taglib
+
+DATA = Path(__file__).parent / "data"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "sub").mkdir()
+    shutil.copyfile(DATA / "r2.mp3", tmp_path / "r2.mp3")
+    shutil.copyfile(DATA / "issue19.flac", tmp_path / "sub" / "issue19.flac")
+    (tmp_path / "sub" / "notes.txt").write_text("no audio")
+    return tmp_path
+
+
+def run(monkeypatch, capsys, *args):
+    monkeypatch.setattr("sys.argv", ["pyprinttags", *map(str, args)])
+    try:
+        pyprinttags.script()
+        code = 0
+    except SystemExit as e:
+        code = e.code
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+def test_text_output(monkeypatch, capsys, tree):
+    code, out, _ = run(monkeypatch, capsys, tree / "r2.mp3")
+    assert code == 0
+    assert out.startswith(f"{tree / 'r2.mp3'}:\n")
+    assert "  TITLE  = I Can Walk On Water I Can Fly\n" in out
+
+
+def test_text_output_in_order(monkeypatch, capsys, tree):
+    flac, mp3 = tree / "sub" / "issue19.flac", tree / "r2.mp3"
+    code, out, _ = run(monkeypatch, capsys, "--jobs", 2, flac, mp3)
+    assert code == 0
+    headers = [line for line in out.splitlines() if line and not line.startswith(" ")]
+    assert headers == [f"{flac}:", f"{mp3}:"]
+
+
+def test_directories_expanded_like_scan(monkeypatch, capsys, tree):
+    code, out, _ = run(monkeypatch, capsys, tree)
+    assert code == 0
+    headers = {line[:-1] for line in out.splitlines() if line and not line.startswith(" ")}
+    assert headers == {str(result.path) for result in taglib.scan(tree)}
+    assert headers == {str(tree / "r2.mp3"), str(tree / "sub" / "issue19.flac")}
+
+
+def test_ndjson(monkeypatch, capsys, tree):
+    code, out, _ = run(monkeypatch, capsys, "--format", "ndjson", "--keys", "title,artist", "-p", tree)
+    assert code == 0
+    records = {Path(rec["path"]).name: rec for rec in map(json.loads, out.splitlines())}
+    assert set(records) == {"r2.mp3", "issue19.flac"}
+    rec = records["r2.mp3"]
+    assert set(rec["tags"]) <= {"TITLE", "ARTIST"}
+    assert rec["tags"]["TITLE"] == ["I Can Walk On Water I Can Fly"]
+    assert rec["length"] > 0
+    assert isinstance(rec["pictures"], list)
+
+
+def test_json_with_error(monkeypatch, capsys, tree):
+    missing = tree / "missing.mp3"
+    code, out, _ = run(monkeypatch, capsys, "--format", "json", tree / "r2.mp3", missing)
+    assert code == 1
+    records = sorted(json.loads(out), key=lambda rec: rec["path"])
+    assert records[0]["path"] == str(missing)
+    assert "error" in records[0]
+    assert records[1]["tags"]["TITLE"] == ["I Can Walk On Water I Can Fly"]
+
+
+def test_tsv(monkeypatch, capsys, tree):
+    code, out, _ = run(monkeypatch, capsys, "--format", "tsv", "--keys", "TITLE", tree / "r2.mp3")
+    assert code == 0
+    assert out.splitlines() == ["path\tkey\tvalue", f"{tree / 'r2.mp3'}\tTITLE\tI Can Walk On Water I Can Fly"]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import taglib
+
+FILES = ["r2.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg"]
+
+
+@pytest.fixture
+def paths(test_data):
+    return [test_data(name) for name in FILES]
+
+
+def test_read_many_returns_same_data_as_file(paths):
+    results = {result.path: result for result in taglib.read_many(paths, workers=2)}
+    assert set(results) == set(paths)
+    for path in paths:
+        with taglib.File(path) as f:
+            result = results[path]
+            assert result.ok
+            assert result.tags == f.tags
+            assert result.unsupported == f.unsupported
+            assert result.length == f.length
+            assert result.bitrate == f.bitrate
+            assert result.sampleRate == f.sampleRate
+            assert result.channels == f.channels
+
+
+def test_read_many_ordered_preserves_input_order(paths):
+    many_paths = paths * 5
+    results = list(taglib.read_many(many_paths, workers=3, ordered=True))
+    assert [result.path for result in results] == many_paths
+
+
+def test_bad_file_does_not_abort_batch(paths, tmp_path):
+    missing = tmp_path / "missing.mp3"
+    results = list(taglib.read_many([paths[0], missing, str(paths[1])], ordered=True))
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, OSError)
+    assert results[1].path == missing
+    assert results[1].tags is None
+    assert isinstance(results[2].path, Path)
+
+
+def test_read_many_accepts_generator(paths):
+    results = list(taglib.read_many(path for path in paths))
+    assert len(results) == len(paths)
+
+
+def test_read_many_process_executor(paths):
+    results = list(taglib.read_many(paths, workers=2, executor="process", ordered=True))
+    assert all(result.ok for result in results)
+    assert results[0].tags["TITLE"] == ["I Can Walk On Water I Can Fly"]
+
+
+def test_read_many_invalid_executor(paths):
+    with pytest.raises(ValueError):
+        list(taglib.read_many(paths, executor="fiber"))
+
+
+def test_import_taglib_does_not_import_multiprocessing():
+    code = "import sys, taglib; print('multiprocessing' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
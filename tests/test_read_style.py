@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import pytest
+
+import taglib
+
+
+@pytest.mark.parametrize("read_style", ["fast", "average", "accurate"])
+def test_read_styles_read_audio_properties(test_data, read_style):
+    with taglib.File(test_data("r2.mp3"), read_style=read_style) as f:
+        assert f.read_style == read_style
+        assert f.length == pytest.approx(222.2, abs=0.5)
+        assert f.sampleRate == 44100
+        assert f.channels == 2
+
+
+def test_read_style_none_skips_audio_properties(test_data):
+    with taglib.File(test_data("r2.mp3"), read_style="none") as f:
+        assert f.tags["TITLE"] == ["I Can Walk On Water I Can Fly"]
+        for attribute in ("length", "bitrate", "sampleRate", "channels"):
+            with pytest.raises(ValueError):
+                getattr(f, attribute)
+
+
+def test_read_style_none_allows_saving(test_data):
+    path = test_data("issue19.flac")
+    with taglib.File(path, read_style="none") as f:
+        f.tags["ARTIST"] = ["changed"]
+        f.save()
+    with taglib.File(path) as f:
+        assert f.tags["ARTIST"] == ["changed"]
+        assert f.length > 0
+
+
+def test_invalid_read_style_raises(test_data):
+    with pytest.raises(ValueError):
+        taglib.File(test_data("r2.mp3"), read_style="sloppy")
+
+
+def test_read_many_with_read_style_none(test_data):
+    [result] = taglib.read_many([test_data("issue19.flac")], read_style="none")
+    assert result.ok
+    assert result.tags["TITLE"] == ["issue19.flac"]
+    assert result.length is None
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import io
+import os
+import sys
+
+import pytest
+
+import taglib
+
+
+def modify(path, title):
+    with taglib.File(path) as other:
+        other.tags["TITLE"] = [title]
+        other.save()
+    # the size does not change when the tag fits into the padding; make sure the mtime does,
+    # even on file systems with coarse timestamps
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+
+@pytest.mark.parametrize("io_mode", [
+    "stream",
+    pytest.param("mmap", marks=pytest.mark.skipif(sys.platform == "win32",
+                                                  reason="mapped files cannot be written on Windows")),
+])
+def test_refresh_if_changed(test_data, io_mode):
+    path = test_data("issue19.flac")
+    with taglib.File(path, io=io_mode) as f:
+        assert f.tags["ARTIST"] == ["This is an artist"]
+        assert not f.refresh_if_changed()
+        modify(path, "changed elsewhere")
+        assert f.refresh_if_changed()
+        assert f.tags["TITLE"] == ["changed elsewhere"]
+        assert f.length > 0
+        assert not f.refresh_if_changed()
+
+
+def test_refresh_after_own_save(test_data):
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = ["saved here"]
+        f.save()
+        assert not f.refresh_if_changed()
+        assert f.tags["TITLE"] == ["saved here"]
+
+
+def test_reload_discards_unsaved_changes(test_data, tiny_png):
+    with taglib.File(test_data("r2.mp3")) as f:
+        f.tags["TITLE"] = ["unsaved"]
+        f.pictures = [taglib.Picture(data=tiny_png, mime_type="image/png")]
+        assert f.is_modified
+        f.reload()
+        assert not f.is_modified
+        assert f.tags["TITLE"] == ["I Can Walk On Water I Can Fly"]
+        assert f.pictures == []
+
+
+def test_reload_keeps_options(test_data):
+    with taglib.File(test_data("issue19.flac"), keys=["artist"], read_style="none") as f:
+        f.reload()
+        assert f.tags == {"ARTIST": ["This is an artist"]}
+        with pytest.raises(ValueError):
+            f.length
+
+
+def test_reload_file_object(test_data):
+    stream = io.BytesIO(test_data("issue19.flac").read_bytes())
+    with taglib.File(stream) as f:
+        with pytest.raises(ValueError):
+            f.refresh_if_changed()
+        with taglib.File(stream) as other:
+            other.tags["TITLE"] = ["in memory"]
+            other.save()
+        f.reload()
+        assert f.tags["TITLE"] == ["in memory"]
+
+
+def test_reload_unreadable_file_closes(test_data):
+    path = test_data("r2.mp3")
+    f = taglib.File(path)
+    path.write_bytes(b"not an audio file")
+    with pytest.raises(OSError):
+        f.refresh_if_changed()
+    assert f.is_closed
+    path.unlink()
+    with pytest.raises(ValueError):
+        f.reload()
+
+
+def test_refresh_deleted_file(test_data):
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        path.unlink()
+        with pytest.raises(OSError):
+            f.refresh_if_changed()
+        assert not f.is_closed
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import io
+import struct
+
+import pytest
+
+import taglib
+
+
+@pytest.mark.parametrize("filename", ["r2.mp3", "issue19.flac"])
+def test_save_reports_in_place(test_data, filename):
+    path = test_data(filename)
+    with taglib.File(path) as f:
+        f.tags["COMMENT"] = ["x" * 20000]
+        # the tag grows beyond any existing padding: the audio data has to be moved
+        assert f.save().in_place is False
+        # after a rewrite, TagLib leaves padding, so small changes fit
+        f.tags["COMMENT"] = ["short"]
+        assert f.save().in_place is True
+        f.tags["TITLE"] = ["a new title"]
+        assert f.save().in_place is True
+        assert f.save().in_place is None
+
+
+def test_in_place_for_file_object(test_data):
+    stream = io.BytesIO(test_data("r2.mp3").read_bytes())
+    with taglib.File(stream) as f:
+        f.tags["COMMENT"] = ["x" * 20000]
+        assert f.save().in_place is False
+        f.tags["COMMENT"] = ["short"]
+        assert f.save().in_place is True
+
+
+def wavpack_block(samples=44100, payload=1000):
+    """A WavPack block with a 16-bit stereo 44.1 kHz header and an empty payload."""
+    flags = 0x1 | 0x800 | 0x1000 | 9 << 23  # 2 bytes per sample, initial and final block, 44.1 kHz
+    header = struct.pack("<4sIHBBIIIII", b"wvpk", 24 + payload, 0x407, 0, 0, samples, 0, samples, flags, 0)
+    return header + bytes(payload)
+
+
+def test_in_place_for_trailing_tags(tmp_path):
+    # WavPack stores tags in an APE tag at the end: when it grows, the file grows but the audio
+    # data is left where it is, so in_place is False without any audio being rewritten
+    path = tmp_path / "trailing.wv"
+    audio = wavpack_block()
+    path.write_bytes(audio)
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = ["first"]
+        assert f.save().in_place is False
+        f.tags["TITLE"] = ["other"]
+        assert f.save().in_place is True
+    assert path.read_bytes().startswith(audio)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import shutil
+from pathlib import Path
+
+import pytest
+
+import taglib
+
+DATA = Path(__file__).parent / "data"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Directory tree with audio files on several levels and some non-audio files."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    shutil.copyfile(DATA / "r2.mp3", tmp_path / "r2.mp3")
+    shutil.copyfile(DATA / "issue19.flac", tmp_path / "a" / "issue19.FLAC")
+    shutil.copyfile(DATA / "has-tags.m4a", tmp_path / "a" / "b" / "has-tags.m4a")
+    (tmp_path / "cover.jpg").write_bytes(b"no audio")
+    (tmp_path / "a" / "notes.txt").write_text("no audio")
+    return tmp_path
+
+
+def test_supported_extensions():
+    extensions = taglib.supported_extensions()
+    assert {"mp3", "flac", "ogg", "m4a"} <= extensions
+    assert all(extension == extension.lower() and not extension.startswith(".") for extension in extensions)
+
+
+def test_scan_recursive(tree):
+    results = list(taglib.scan(tree, workers=2))
+    assert sorted(result.path.relative_to(tree).as_posix() for result in results) == [
+        "a/b/has-tags.m4a", "a/issue19.FLAC", "r2.mp3"]
+    assert all(result.ok for result in results)
+
+
+def test_scan_not_recursive(tree):
+    results = list(taglib.scan(str(tree), recursive=False))
+    assert [result.path for result in results] == [tree / "r2.mp3"]
+    assert results[0].tags["TITLE"] == ["I Can Walk On Water I Can Fly"]
+
+
+def test_scan_extensions(tree):
+    results = list(taglib.scan(tree, extensions=[".flac", "M4A"], keys=["title"], read_style="none"))
+    assert sorted(result.path.name for result in results) == ["has-tags.m4a", "issue19.FLAC"]
+    assert all(set(result.tags) <= {"TITLE"} and result.length is None for result in results)
+
+
+def test_scan_reports_unreadable_files(tree):
+    (tree / "broken.flac").write_bytes(b"no audio")
+    results = {result.path.name: result for result in taglib.scan(tree)}
+    assert not results["broken.flac"].ok
+    assert results["r2.mp3"].ok
+
+
+def test_scan_missing_root(tmp_path):
+    with pytest.raises(OSError):
+        list(taglib.scan(tmp_path / "missing"))
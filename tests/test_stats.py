@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import pytest
+
+import taglib
+
+
+@pytest.fixture
+def stats():
+    taglib.reset_stats()
+    taglib.enable_stats()
+    yield
+    taglib.enable_stats(False)
+    taglib.reset_stats()
+
+
+def test_stats_disabled_by_default(test_data):
+    taglib.reset_stats()
+    with taglib.File(test_data("r2.mp3")) as f:
+        f.tags
+    assert taglib.stats()["opens"] == 0
+
+
+def test_open_and_conversion(stats, test_data):
+    for name in ["r2.mp3", "issue19.flac"]:
+        with taglib.File(test_data(name)) as f:
+            f.tags
+            f.tags
+    result = taglib.stats()
+    assert result["opens"] == 2
+    assert result["open_time"] > 0
+    assert result["tag_conversions"] == 2
+    assert result["tag_conversion_time"] > 0
+    assert result["open_failures"] == {}
+
+
+def test_open_failures_per_format(stats, tmp_path):
+    for name in ["a.flac", "b.flac", "c.ogg"]:
+        (tmp_path / name).write_bytes(b"no audio")
+        with pytest.raises(OSError):
+            taglib.File(tmp_path / name)
+    result = taglib.stats()
+    assert result["opens"] == 3
+    assert result["open_failures"] == {"flac": 2, "ogg": 1}
+
+
+def test_complex_property_bytes(stats, test_data, tiny_png):
+    with taglib.File(test_data("r2.mp3")) as f:
+        f.pictures = [taglib.Picture(data=tiny_png, mime_type="image/png")]
+        before = taglib.stats()["complex_property_bytes"]
+        f.pictures
+        f.get_pictures(copy=False)
+    assert taglib.stats()["complex_property_bytes"] - before == 2 * len(tiny_png)
+
+
+def test_setting_pictures_does_not_count_bytes(stats, test_data, tiny_png):
+    with taglib.File(test_data("r2.mp3")) as f:
+        f.pictures = [taglib.Picture(data=tiny_png, mime_type="image/png")]
+        f.pictures = [taglib.Picture(data=tiny_png, mime_type="image/png")]
+    assert taglib.stats()["complex_property_bytes"] == 0
+
+
+def test_saves(stats, test_data):
+    with taglib.File(test_data("r2.mp3")) as f:
+        f.save()  # not modified, not counted
+        f.tags["TITLE"] = ["new"]
+        f.save()
+    result = taglib.stats()
+    assert result["saves"] == 1
+    assert result["save_time"] > 0
+    assert result["save_failures"] == {}
+
+
+def test_reset_and_snapshot(stats, test_data):
+    taglib.File(test_data("r2.mp3")).close()
+    snapshot = taglib.stats()
+    taglib.reset_stats()
+    assert snapshot["opens"] == 1
+    assert taglib.stats()["opens"] == 0
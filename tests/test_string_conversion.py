@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import pytest
+
+import taglib
+
+VALUES = [
+    "",
+    "plain ascii",
+    "Grüße aus Köln",
+    "Жбж",
+    "日本語のタイトル",
+    "\U0001F3B5 with emoji \U0001F3B6",
+    "\U00010400",
+    "mixed ä Ж 日 \U0001F600",
+]
+
+
+@pytest.mark.parametrize("filename", ["issue19.flac", "r2.mp3"])
+def test_round_trip(test_data, filename):
+    path = test_data(filename)
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = VALUES[1:]
+        f.tags["COMMENT"] = ["\U0001F3B5"]
+        f.save()
+    with taglib.File(path) as f:
+        assert f.tags["TITLE"] == VALUES[1:]
+        assert f.tags["COMMENT"] == ["\U0001F3B5"]
+
+
+def test_byte_order_mark_is_kept(test_data):
+    # a BOM followed by surrogates must not be interpreted when decoding UTF-16
+    path = test_data("issue19.flac")
+    with taglib.File(path) as f:
+        f.tags["TITLE"] = ["\ufeff\U0001F3B5", "\ufeffx"]
+        f.save()
+    with taglib.File(path) as f:
+        assert f.tags["TITLE"] == ["\ufeff\U0001F3B5", "\ufeffx"]
+
+
+def test_non_ascii_keys(test_data):
+    path = test_data("issue19.flac")
+    with taglib.File(path) as f:
+        f.tags["KÖLN"] = ["x"]
+        f.save()
+    with taglib.File(path) as f:
+        assert f.tags["KÖLN"] == ["x"]
+
+
+def test_lone_surrogate_is_rejected(test_data):
+    with taglib.File(test_data("issue19.flac")) as f:
+        f.tags["TITLE"] = ["bad \udc80 value"]
+        with pytest.raises(UnicodeEncodeError):
+            f.save()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+"""Tests for using pytaglib from multiple threads.
+
+TagLib releases the GIL while parsing and saving files; ``benchmarks/test_thread_scaling.py``
+measures how reading on a thread pool scales with the number of threads.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import taglib
+
+FILES = ["r2.mp3", "onlyv1.mp3", "issue19.flac", "testöü.flac", "has-tags.m4a", "lowercase-fields.ogg"]
+
+
+def read(path):
+    with taglib.File(path) as f:
+        return f.tags, f.length, f.bitrate
+
+
+def test_threaded_reads_match_sequential_reads(test_data):
+    paths = [test_data(name) for name in FILES] * 10
+    expected = [read(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(read, paths)) == expected
+
+
+def test_threaded_saves(test_data):
+    paths = [test_data(name) for name in FILES]
+
+    def write(path):
+        with taglib.File(path, save_on_exit=True) as f:
+            f.tags["THREAD"] = [path.name]
+            f.pictures = []
+
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        list(pool.map(write, paths))
+    for path in paths:
+        with taglib.File(path) as f:
+            assert f.tags["THREAD"] == [path.name]
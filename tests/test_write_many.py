@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import taglib
+
+FILES = ["r2.mp3", "issue19.flac", "has-tags.m4a", "lowercase-fields.ogg"]
+
+
+def test_write_many_updates_given_tags(test_data):
+    paths = [test_data(name) for name in FILES]
+    before = {}
+    for path in paths:
+        with taglib.File(path) as f:
+            before[path] = f.tags
+    results = list(taglib.write_many({path: {"genre": ["Jazz"], "TITLE": None} for path in paths}, workers=2))
+    assert sorted(result.path for result in results) == sorted(paths)
+    for result in results:
+        assert result.ok and result.written
+        assert result.unsaved == {}
+        assert result.elapsed > 0
+        with taglib.File(result.path) as f:
+            expected = dict(before[result.path], GENRE=["Jazz"])
+            expected.pop("TITLE", None)
+            assert f.tags == expected
+
+
+def test_write_many_reports_errors_and_unchanged_files(test_data, tmp_path):
+    path = test_data("r2.mp3")
+    missing = tmp_path / "missing.mp3"
+    changes = [(path, {"TITLE": ["I Can Walk On Water I Can Fly"]}), (str(missing), {"TITLE": ["x"]})]
+    unchanged, failed = taglib.write_many(changes, ordered=True)
+    assert unchanged.ok and not unchanged.written
+    assert failed.path == missing
+    assert isinstance(failed.error, OSError)
+    assert failed.unsaved is None
+
+
+def test_write_many_pictures(test_data, tiny_png):
+    paths = [test_data("r2.mp3"), test_data("issue19.flac")]
+    picture = taglib.Picture(data=tiny_png, mime_type="image/png")
+    results = list(taglib.write_many({path: {} for path in paths}, pictures={str(paths[0]): [picture]},
+                                     ordered=True))
+    assert [result.written for result in results] == [True, False]
+    with taglib.File(paths[0]) as f:
+        assert f.pictures[0].data == tiny_png
+
+
+def test_write_many_process_executor(test_data):
+    paths = [test_data(name) for name in FILES]
+    results = list(taglib.write_many({path: {"GENRE": ["Jazz"]} for path in paths}, workers=2,
+                                     executor="process"))
+    assert all(result.ok and result.written for result in results)
+    for result in results:
+        with taglib.File(result.path) as f:
+            assert f.tags["GENRE"] == ["Jazz"]
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Michael Helmling
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation
+#
+import hashlib
+
+import pytest
+
+import taglib
+from taglib import Picture
+
+
+@pytest.fixture
+def mp3_with_picture(test_data, tiny_png):
+    path = test_data("r2.mp3")
+    with taglib.File(path) as f:
+        f.pictures = [Picture(data=tiny_png, mime_type="image/png", description="cover")]
+        f.save()
+    return path
+
+
+def test_get_pictures_without_copy(mp3_with_picture, tiny_png):
+    with taglib.File(mp3_with_picture) as f:
+        [picture] = f.get_pictures(copy=False)
+    assert isinstance(picture.data, memoryview)
+    assert picture.data.readonly
+    assert picture.data == tiny_png
+    assert hashlib.sha256(picture.data).digest() == hashlib.sha256(tiny_png).digest()
+    assert picture.description == "cover"
+
+
+def test_view_is_read_only(mp3_with_picture):
+    with taglib.File(mp3_with_picture) as f:
+        [picture] = f.get_pictures(copy=False)
+    with pytest.raises(TypeError):
+        picture.data[0] = 0
+
+
+def test_complex_properties_without_copy(mp3_with_picture, tiny_png):
+    with taglib.File(mp3_with_picture) as f:
+        [props] = f.complex_properties("PICTURE", copy=False)
+    assert isinstance(props["data"], memoryview)
+    assert bytes(props["data"]) == tiny_png
+
+
+def test_write_picture_from_view(mp3_with_picture, test_data, tiny_png):
+    with taglib.File(mp3_with_picture) as f:
+        pictures = f.get_pictures(copy=False)
+    target = test_data("xing.mp3")
+    with taglib.File(target) as f:
+        f.pictures = pictures
+        f.save()
+    with taglib.File(target) as f:
+        assert f.pictures[0].data == tiny_png